@@ -0,0 +1,211 @@
+import copy
+import os
+import pickle
+import threading
+
+from catalog import normalize_track, DEFAULT_TRACK
+from policy import get_policy
+from recommender import make_profile, recommend
+
+# Answer tables are a build cache, kept out of the catalog directory
+DEFAULT_ANSWER_DIR = os.getenv(
+    'ANSWER_TABLE_DIR',
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), '.cache', 'answers')
+)
+# Saved tables kept on disk, most recently used first; older versions are deleted
+ANSWER_TABLES_KEPT = int(os.getenv('ANSWER_TABLES_KEPT', 8))
+ANSWER_FILE_PREFIX = 'answers_'
+
+# Standard plan alternates regular terms; one CGPA per policy credit tier stands in for the tier
+STANDARD_TERMS = ('Fall', 'Spring')
+MAX_TERMS = 12
+
+
+def _bitmask(catalog, codes):
+    """Encode course codes as a bitmask over catalog ids, or None if any code is unknown"""
+    mask = 0
+    for code in codes:
+        course_id = catalog.code_to_id.get(code)
+        if course_id is None:
+            return None
+        mask |= 1 << course_id
+    return mask
+
+
+def state_key(catalog, profile, policy):
+    """Key identifying the academic progress state a recommendation depends on"""
+    passed = _bitmask(catalog, profile.passed)
+    failed = _bitmask(catalog, profile.failed)
+    if passed is None or failed is None:
+        return None
+    return (
+        normalize_track(profile.track),
+        str(profile.semester).strip().lower(),
+        policy.credit_limit(profile.cgpa, profile.semester),
+        passed,
+        failed
+    )
+
+
+class AnswerTable:
+    """Precomputed recommendations for the states reachable along the standard study plan"""
+
+    def __init__(self, version, policy):
+        # Catalog and policy version the answers were computed for
+        self.version = version
+        self.policy = policy
+        self.answers = {}
+        self.sources = {'standard': 0, 'one_failure': 0}
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def _add(self, catalog, profile, source):
+        """Materialize one state's recommendation unless it is already in the table, and return it"""
+        key = state_key(catalog, profile, self.policy)
+        if key is None:
+            return recommend(catalog, profile, self.policy)
+        if key not in self.answers:
+            self.answers[key] = recommend(catalog, profile, self.policy)
+            self.sources[source] += 1
+        return self.answers[key]
+
+    def lookup(self, catalog, profile):
+        """Return a copy of the materialized answer for a profile, or None on a miss.
+
+        Answers are shared by every request, so callers get their own copy to modify.
+        """
+        result = None
+        if self.policy.cache_key(catalog) == self.version:
+            key = state_key(catalog, profile, self.policy)
+            result = None if key is None else self.answers.get(key)
+        with self._lock:
+            if result is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return None if result is None else copy.deepcopy(result)
+
+    def recommend(self, catalog, profile):
+        """Answer from the table when possible, falling back to live evaluation"""
+        result = self.lookup(catalog, profile)
+        return recommend(catalog, profile, self.policy) if result is None else result
+
+    def stats(self):
+        """Coverage statistics: table size, how it was built and how much traffic it absorbs"""
+        with self._lock:
+            hits, misses = self.hits, self.misses
+        requests = hits + misses
+        return {
+            'version': self.version,
+            'states': len(self.answers),
+            'standard_states': self.sources['standard'],
+            'one_failure_states': self.sources['one_failure'],
+            'hits': hits,
+            'misses': misses,
+            'hit_rate': hits / requests if requests else 0.0
+        }
+
+    def save(self, filename):
+        """Write the table to disk; readers never see a partly written file"""
+        os.makedirs(os.path.dirname(os.path.abspath(filename)), exist_ok=True)
+        partial = f"{filename}.{os.getpid()}.tmp"
+        with open(partial, 'wb') as file:
+            pickle.dump({'version': self.version, 'answers': self.answers,
+                         'sources': self.sources}, file)
+        os.replace(partial, filename)
+
+
+def answer_table_path(version, directory=DEFAULT_ANSWER_DIR):
+    """File a table for a catalog and policy version is saved to"""
+    return os.path.join(directory, f"{ANSWER_FILE_PREFIX}{version}.pkl")
+
+
+def prune_answer_tables(directory=DEFAULT_ANSWER_DIR, keep=ANSWER_TABLES_KEPT):
+    """Delete all but the `keep` most recently used saved tables and return the deleted files"""
+    try:
+        names = [name for name in os.listdir(directory)
+                 if name.startswith(ANSWER_FILE_PREFIX) and name.endswith('.pkl')]
+    except FileNotFoundError:
+        return []
+    files = sorted((os.path.join(directory, name) for name in names), key=os.path.getmtime, reverse=True)
+    for filename in files[keep:]:
+        os.remove(filename)
+    return files[keep:]
+
+
+def save_answer_table(table, directory=DEFAULT_ANSWER_DIR, keep=ANSWER_TABLES_KEPT):
+    """Save a table into the answer cache, dropping the least recently used versions, and return its file"""
+    filename = answer_table_path(table.version, directory)
+    table.save(filename)
+    prune_answer_tables(directory, keep)
+    return filename
+
+
+def build_answer_table(catalog, policy=None, tracks=None, terms=STANDARD_TERMS, max_terms=MAX_TERMS):
+    """Enumerate standard-progression states and their one-failure deviations, and materialize them"""
+    policy = policy or get_policy()
+    table = AnswerTable(policy.cache_key(catalog), policy)
+    for track in tracks or catalog.tracks or [DEFAULT_TRACK]:
+        for cgpa in policy.tier_cgpas():
+            for first_term in range(len(terms)):
+                passed = frozenset()
+                for term_index in range(max_terms):
+                    semester = terms[(first_term + term_index) % len(terms)]
+                    result = table._add(catalog, make_profile(cgpa, semester, passed, (), track), 'standard')
+                    taken = frozenset(course['code'] for course in result.recommended)
+                    if not taken:
+                        break
+
+                    # Next term after passing everything but one recommended course
+                    next_semester = terms[(first_term + term_index + 1) % len(terms)]
+                    for code in taken:
+                        table._add(catalog, make_profile(cgpa, next_semester, passed | (taken - {code}), {code}, track),
+                                   'one_failure')
+                    passed |= taken
+    return table
+
+
+def load_answer_table(filename, catalog, policy=None):
+    """Load a saved table, or return None if it was built for another catalog or policy version.
+
+    Tables are pickles, so only load files the answer cache wrote itself.
+    """
+    policy = policy or get_policy()
+    try:
+        with open(filename, 'rb') as file:
+            data = pickle.load(file)
+    except FileNotFoundError:
+        return None
+    if not isinstance(data, dict) or data.get('version') != policy.cache_key(catalog):
+        return None
+    # Mark the table as recently used so pruning keeps it
+    os.utime(filename)
+    table = AnswerTable(data['version'], policy)
+    table.answers = data['answers']
+    table.sources = data['sources']
+    return table
+
+
+def main():
+    """Precompute the answer table for a registered catalog and report its coverage"""
+    import sys
+    from catalog_registry import CatalogRegistry, DEFAULT_PROGRAM
+
+    program = sys.argv[1] if len(sys.argv) > 1 else DEFAULT_PROGRAM
+    year = sys.argv[2] if len(sys.argv) > 2 else None
+    try:
+        catalog = CatalogRegistry().get(program, year)
+    except (KeyError, OSError, ValueError) as e:
+        print(f"Failed to load courses: {e}")
+        return
+
+    table = build_answer_table(catalog)
+    output_file = save_answer_table(table)
+    stats = table.stats()
+    print(f"Version {stats['version']}: {stats['states']} states "
+          f"({stats['standard_states']} standard, {stats['one_failure_states']} one-failure) -> {output_file}")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,10 +4,19 @@
 
 import streamlit as st
 import pandas as pd
-from pathlib import Path
 import os
 import csv
 from experta import *
+from catalog import CompiledCatalog, DEFAULT_TRACK
+from recommender import make_profile, recommend
+from policy import get_policy
+from engine_pool import EnginePool, DEFAULT_POOL_SIZE
+from answer_table import load_answer_table, answer_table_path
+from catalog_registry import CatalogRegistry, DEFAULT_PROGRAM
+from catalog_loader import catalog_frame
+from what_if import WhatIfSession
+from kb_validator import validate_catalog, has_errors
+from ranking import get_ranker
 
 # --------------------------
 # EXPERT SYSTEM CLASSES
@@ -32,218 +41,71 @@ class CourseRecommendationSystem(KnowledgeEngine):
     def __init__(self):
         super().__init__()
         self.courses = []
+        self.catalog = CompiledCatalog([])
         self.recommended_courses = []
         self.total_credits = 0
         self.max_credits = 0
         self.student_data = {}
         self.skipped_courses = []
         self.explanations = []  # Store detailed explanations
+        # Policy resolved for the current run, and optional relevance ranking
+        self.policy = None
+        self.ranker = None
+        self.interest = ''
         
-    def load_courses_from_dataframe(self, df):
-        """Load courses from pandas DataFrame"""
-        self.courses = []
-        for _, row in df.iterrows():
-            course = {
-                'code': str(row['Course Code']).strip() if pd.notna(row['Course Code']) else '',
-                'name': str(row['Course Name']).strip() if pd.notna(row['Course Name']) else '',
-                'description': str(row['Description']).strip() if pd.notna(row['Description']) else '',
-                'prerequisites': self._parse_course_list(row['Prerequisites']),
-                'corequisites': self._parse_course_list(row['Co-requisites']),
-                'credit_hours': int(row['Credit Hours']) if pd.notna(row['Credit Hours']) else 0,
-                'semester_offered': str(row['Semester Offered']).strip() if pd.notna(row['Semester Offered']) else '',
-                'program_track': str(row['Program/Track']).strip() if pd.notna(row['Program/Track']) else ''
-            }
-            self.courses.append(course)
-    
-    def _parse_course_list(self, course_string):
-        """Parse comma-separated course codes"""
-        if pd.isna(course_string) or str(course_string).strip() == '' or str(course_string).strip().lower() == 'none':
-            return []
-        return [code.strip() for code in str(course_string).split(',') if code.strip()]
-    
-    def _is_track_eligible(self, program_track):
-        """Check if course is eligible for Computer Engineering track"""
-        track_lower = program_track.lower()
-        return 'all' in track_lower or 'computer engineering' in track_lower
-    
-    def _is_semester_eligible(self, semester_offered, current_semester):
-        """Check if course is offered in current semester"""
-        return (semester_offered.lower() == current_semester.lower() or 
-                semester_offered.lower() == 'both')
-    
-    def _has_prerequisites(self, prerequisites, passed_courses):
-        """Check if student has completed all prerequisites"""
-        return all(prereq in passed_courses for prereq in prerequisites)
-    
-    def _has_corequisites(self, corequisites, passed_courses, current_recommendations):
-        """Check if corequisites are satisfied (passed or being taken concurrently)"""
-        for coreq in corequisites:
-            if coreq not in passed_courses and coreq not in current_recommendations:
-                return False
-        return True
+    def use_catalog(self, catalog):
+        """Share an already compiled catalog instead of loading courses again"""
+        self.catalog = catalog
+        self.courses = list(catalog.courses)
     
-    @Rule(StudentInfo(cgpa=MATCH.cgpa))
-    def set_credit_limit(self, cgpa):
-        """Set maximum credit hours based on CGPA"""
-        if cgpa < 2.0:
-            self.max_credits = 12
-        elif cgpa <= 3.0:
-            self.max_credits = 15
-        else:
-            self.max_credits = 18
+    def reset(self, **kwargs):
+        """Clear facts and per-run state so the engine can be reused"""
+        super().reset(**kwargs)
+        self.recommended_courses = []
+        self.total_credits = 0
+        self.max_credits = 0
+        self.skipped_courses = []
+        self.explanations = []
+        self.policy = None
+        self.ranker = None
+        self.interest = ''
     
-    def _generate_explanation(self, course, reason_type, details=None):
-        """Generate a detailed explanation for a course recommendation or restriction"""
-        explanation = {
-            'code': course['code'],
-            'name': course['name'],
-            'type': reason_type,
-            'details': details or {}
-        }
-        self.explanations.append(explanation)
-        return explanation
-
-    def _add_recommendation_explanation(self, course, passed_courses):
-        """Add detailed explanation for a recommended course"""
-        details = {
-            'prerequisites_met': [prereq for prereq in course['prerequisites'] if prereq in passed_courses],
-            'corequisites_met': [coreq for coreq in course['corequisites'] if coreq in passed_courses],
-            'semester_match': course['semester_offered'],
-            'track_match': course['program_track']
-        }
-        return self._generate_explanation(course, 'recommended', details)
-
-    def _add_restriction_explanation(self, course, reason, details=None):
-        """Add detailed explanation for a restricted course"""
-        return self._generate_explanation(course, 'restricted', {
-            'reason': reason,
-            **(details or {})
-        })
+    @Rule(StudentInfo(cgpa=MATCH.cgpa, semester=MATCH.semester))
+    def set_credit_limit(self, cgpa, semester):
+        """Set maximum credit hours from the policy's CGPA tiers and term maximum"""
+        self.max_credits = self.policy.credit_limit(cgpa, semester)
 
     @Rule(StudentInfo(cgpa=MATCH.cgpa, 
                      semester=MATCH.semester, 
                      passed_courses=MATCH.passed, 
-                     failed_courses=MATCH.failed))
-    def recommend_courses(self, cgpa, semester, passed, failed):
+                     failed_courses=MATCH.failed,
+                     track=MATCH.track))
+    def recommend_courses(self, cgpa, semester, passed, failed, track):
         """Main rule to recommend courses"""
-        for course in self.courses:
-            course_code = course['code']
-            course_name = course['name']
-            credit_hours = course['credit_hours']
-            
-            # Skip if already passed
-            if course_code in passed:
-                self._add_restriction_explanation(course, 'already_passed', {
-                    'semester_passed': 'Previously completed'
-                })
-                continue
-                
-            # Skip if currently failed (might need retaking)
-            if course_code in failed:
-                self._add_restriction_explanation(course, 'previously_failed', {
-                    'priority': 'high',
-                    'action_needed': 'Consider retaking'
-                })
-                self.skipped_courses.append({
-                    'code': course_code,
-                    'name': course_name,
-                    'reason': 'Course previously failed - may need retaking'
-                })
-                continue
-            
-            # Check track eligibility
-            if not self._is_track_eligible(course['program_track']):
-                self._add_restriction_explanation(course, 'track_mismatch', {
-                    'current_track': 'Computer Engineering',
-                    'course_track': course['program_track']
-                })
-                self.skipped_courses.append({
-                    'code': course_code,
-                    'name': course_name,
-                    'reason': f"Track mismatch - {course['program_track']}"
-                })
-                continue
-            
-            # Check semester eligibility
-            if not self._is_semester_eligible(course['semester_offered'], semester):
-                self._add_restriction_explanation(course, 'semester_mismatch', {
-                    'current_semester': semester,
-                    'offered_semester': course['semester_offered']
-                })
-                self.skipped_courses.append({
-                    'code': course_code,
-                    'name': course_name,
-                    'reason': f"Not offered in {semester} semester"
-                })
-                continue
-            
-            # Check prerequisites
-            if not self._has_prerequisites(course['prerequisites'], passed):
-                missing_prereqs = [p for p in course['prerequisites'] if p not in passed]
-                self._add_restriction_explanation(course, 'missing_prerequisites', {
-                    'missing_courses': missing_prereqs,
-                    'required_courses': course['prerequisites']
-                })
-                self.skipped_courses.append({
-                    'code': course_code,
-                    'name': course_name,
-                    'reason': f"Missing prerequisites: {', '.join(missing_prereqs)}"
-                })
-                continue
-            
-            # Check corequisites
-            current_recommendation_codes = [r['code'] for r in self.recommended_courses]
-            if not self._has_corequisites(course['corequisites'], passed, current_recommendation_codes):
-                missing_coreqs = [c for c in course['corequisites'] 
-                                if c not in passed and c not in current_recommendation_codes]
-                self._add_restriction_explanation(course, 'missing_corequisites', {
-                    'missing_courses': missing_coreqs,
-                    'required_courses': course['corequisites']
-                })
-                self.skipped_courses.append({
-                    'code': course_code,
-                    'name': course_name,
-                    'reason': f"Missing corequisites: {', '.join(missing_coreqs)}"
-                })
-                continue
-            
-            # Check credit limit
-            if self.total_credits + credit_hours > self.max_credits:
-                self._add_restriction_explanation(course, 'credit_limit', {
-                    'current_credits': self.total_credits,
-                    'course_credits': credit_hours,
-                    'max_credits': self.max_credits
-                })
-                self.skipped_courses.append({
-                    'code': course_code,
-                    'name': course_name,
-                    'reason': f"Would exceed credit limit ({self.total_credits + credit_hours} > {self.max_credits})"
-                })
-                continue
-            
-            # Course is eligible - add to recommendations with explanation
-            self.recommended_courses.append({
-                'code': course_code,
-                'name': course_name,
-                'credit_hours': credit_hours
-            })
-            self.total_credits += credit_hours
-            self._add_recommendation_explanation(course, passed)
+        # The shared stateless core does the work; the engine only keeps the outcome
+        result = recommend(self.catalog, make_profile(cgpa, semester, passed, failed, track),
+                           self.policy, self.ranker, self.interest)
+        self.recommended_courses = result.recommended
+        self.skipped_courses = result.skipped
+        self.total_credits = result.total_credits
+        self.max_credits = result.max_credits
+        self.explanations = result.explanations
     
-    def get_recommendations(self, cgpa, semester, passed_courses, failed_courses):
-        """Get course recommendations"""
-        # Reset state
-        self.recommended_courses = []
-        self.total_credits = 0
-        self.max_credits = 0
-        self.skipped_courses = []
-        
-        # Declare facts
+    def get_recommendations(self, cgpa, semester, passed_courses, failed_courses, track=DEFAULT_TRACK,
+                            ranker=None, interest='', policy=None):
+        """Get course recommendations, most relevant first when a ranker is given"""
+        # Clear facts and state left over from a previous run, then declare facts
+        self.reset()
+        # Resolve the policy once; every rule of this run reads the same one
+        self.policy = policy or get_policy()
+        self.ranker = ranker
+        self.interest = interest
         self.declare(StudentInfo(
             cgpa=cgpa,
             semester=semester,
             passed_courses=passed_courses,
-            failed_courses=failed_courses
+            failed_courses=failed_courses,
+            track=track
         ))
         
         # Run the engine
@@ -254,54 +116,122 @@ class CourseRecommendationSystem(KnowledgeEngine):
 # --------------------------
 # ADVISOR FUNCTION
 # --------------------------
-def run_advisor(cgpa, semester, passed, failed, kb_df):
-    """Run the course advisor and return recommendations"""
-    system = CourseRecommendationSystem()
-    system.load_courses_from_dataframe(kb_df)
-    
-    recommendations, skipped_courses, total_credits, max_credits, explanations = system.get_recommendations(
-        cgpa, semester, passed, failed
-    )
+def run_advisor(cgpa, semester, passed, failed, pool, track=DEFAULT_TRACK, catalog=None, answers=None,
+                ranker=None, interest='', policy=None):
+    """Answer from the precomputed table when possible, otherwise run a pooled engine.
+
+    The table holds unranked answers, so ranked requests always run an engine.
+    """
+    if answers is not None and ranker is None:
+        result = answers.lookup(catalog, make_profile(cgpa, semester, passed, failed, track))
+        if result is not None:
+            return result.recommended, result.skipped, result.total_credits, result.max_credits, result.explanations
+
+    with pool.engine() as system:
+        recommendations, skipped_courses, total_credits, max_credits, explanations = system.get_recommendations(
+            cgpa, semester, passed, failed, track, ranker, interest, policy
+        )
     
     return recommendations, skipped_courses, total_credits, max_credits, explanations
 
+def run_incremental_advisor(cgpa, semester, passed, failed, catalog, track=DEFAULT_TRACK, ranker=None, interest='',
+                            policy=None):
+    """Update the student's what-if session, re-evaluating only the courses affected by the edit"""
+    policy = policy or get_policy()
+    session = st.session_state.get('what_if_session')
+    if (session is None or session.catalog is not catalog or session.ranker is not ranker
+            or session.policy is not policy or (session.semester, session.track) != (semester, track)):
+        session = WhatIfSession(catalog, cgpa, semester, track, passed, failed, ranker, interest, policy)
+        st.session_state.what_if_session = session
+    else:
+        session.update(passed, failed, cgpa, interest)
+    
+    result = session.result
+    return result.recommended, result.skipped, result.total_credits, result.max_credits, result.explanations
+
 # --------------------------
 # CONFIGURATION
 # --------------------------
-KB_FILE = os.getenv('KB_FILE', '../data/CE_Cloud.csv')
 MAX_CREDITS = 18  # General advisory warning limit
+ENGINE_POOL_SIZE = int(os.getenv('ENGINE_POOL_SIZE', DEFAULT_POOL_SIZE))
 
 # --------------------------
 # LOAD KNOWLEDGE BASE
 # --------------------------
-@st.cache_data
-def load_kb():
-    file_path = Path(KB_FILE)
-    if not file_path.exists():
-        raise FileNotFoundError(f"Knowledge base file '{KB_FILE}' not found.")
-
-    try:
-        df = pd.read_csv(file_path)
-        df.columns = [col.strip() for col in df.columns]
+@st.cache_resource
+def load_registry():
+    """One catalog registry per server process, shared by every session"""
+    return CatalogRegistry()
 
-        # Convert credit hours to numeric, replacing empty strings with 0
-        df['Credit Hours'] = pd.to_numeric(df['Credit Hours'].fillna(0), errors='coerce')
-        df['Credit Hours'] = df['Credit Hours'].fillna(0).astype(int)
-
-        # Drop rows where all important columns are empty
-        important_cols = ['Course Code', 'Course Name', 'Credit Hours']
-        df = df.dropna(subset=important_cols, how='all')
+def load_kb(catalog):
+    """Validate the loaded catalog and return it as the table shown in the UI.
 
+    The table is built from the registry's compiled catalog rather than read from the file again,
+    and the registry keeps it with the catalog.
+    """
+    try:
+        df = catalog_frame(catalog)
         if df.empty:
             raise ValueError("The knowledge base file is empty after processing.")
 
+        # Gate the reload on catalog integrity
+        findings = validate_catalog(df)
+        if has_errors(findings):
+            details = '; '.join(f"{f['code']}: {f['detail']}" for f in findings if f['severity'] == 'error')
+            raise ValueError(f"The knowledge base failed integrity checks: {details}")
+
         return df
     except Exception as e:
         st.error(f"Error loading knowledge base: {str(e)}")
         raise
 
+def load_engine_pool(catalog):
+    """Pre-warm a pool of expert system engines sharing the compiled catalog"""
+    def make_engine():
+        system = CourseRecommendationSystem()
+        system.use_catalog(catalog)
+        return system
+    return EnginePool(make_engine, size=ENGINE_POOL_SIZE)
+
+def load_answers(catalog, policy):
+    """Load the answer table built for this catalog and policy version, or None if none was built.
+
+    Tables are built offline with `python answer_table.py`; without one every request runs an engine.
+    """
+    return load_answer_table(answer_table_path(policy.cache_key(catalog)), catalog, policy)
+
+registry = load_registry()
+programs = registry.programs()
+if not programs:
+    st.error("❌ No catalog files found")
+    st.stop()
+program = st.sidebar.selectbox(
+    "📚 Catalog", programs,
+    index=programs.index(DEFAULT_PROGRAM) if DEFAULT_PROGRAM in programs else 0
+)
+catalog_years = registry.years(program)
+catalog_year = catalog_years[-1]
+if len(catalog_years) > 1:
+    catalog_year = st.sidebar.selectbox(
+        "📅 Catalog Year", catalog_years, index=len(catalog_years) - 1, format_func=lambda year: year or "Undated"
+    )
+
 try:
-    kb_df = load_kb()
+    kb_file = registry.path(program, catalog_year)
+    # The raw table, engine pool and answer table are owned by the registry, so they are
+    # released together with the catalog when it is evicted
+    kb_catalog = registry.get(program, catalog_year)
+    kb_df = registry.derived(program, catalog_year, 'frame', load_kb)
+    for report in registry.load_reports(program, catalog_year):
+        if report.errors:
+            st.warning(f"⚠️ {report.summary()}")
+    engine_pool = registry.derived(program, catalog_year, 'engine_pool', load_engine_pool)
+    policy = get_policy()
+    # A missing table is remembered too; the file's presence is part of the version so a table
+    # built offline is picked up on the next run
+    answer_file = answer_table_path(policy.cache_key(kb_catalog))
+    answer_table = registry.derived(program, catalog_year, 'answers', lambda catalog: load_answers(catalog, policy),
+                                    (policy.version, os.path.exists(answer_file)))
 except Exception as e:
     st.error(f"❌ Failed to load knowledge base: {e}")
     st.stop()
@@ -310,10 +240,9 @@ except Exception as e:
 # UI - HEADER
 # --------------------------
 st.title("📘 AIU Course Registration Advisor")
-st.subheader("🎓 Cloud Computing Track")
 
 # Display system info
-st.info(f"📊 Knowledge Base: {len(kb_df)} courses loaded from {KB_FILE}")
+st.info(f"📊 Knowledge Base: {len(kb_df)} courses loaded from {kb_file}")
 
 # --------------------------
 # SIDEBAR - STUDENT INPUT
@@ -323,19 +252,24 @@ st.sidebar.header("🧑‍🎓 Student Information")
 cgpa = st.sidebar.number_input("Enter your CGPA", min_value=0.0, max_value=4.0, step=0.01, value=0.0)
 semester = st.sidebar.selectbox("Current Semester", ["Fall", "Spring", "Summer"])
 
+track_options = kb_catalog.tracks or [DEFAULT_TRACK]
+track = st.sidebar.selectbox(
+    "Program/Track", track_options,
+    index=track_options.index(DEFAULT_TRACK) if DEFAULT_TRACK in track_options else 0
+)
+st.subheader(f"🎓 {track} Track")
+
 all_courses = kb_df['Course Code'].dropna().unique().tolist()
 passed = st.sidebar.multiselect("✅ Passed Courses", options=all_courses)
 failed = st.sidebar.multiselect("❌ Failed Courses", options=[c for c in all_courses if c not in passed])
 
-# Credit limit info based on CGPA
+# Credit limit info from the advising policy
 if cgpa > 0:
-    if cgpa < 2.0:
-        credit_limit = 12
-    elif cgpa <= 3.0:
-        credit_limit = 15
-    else:
-        credit_limit = 18
+    credit_limit = policy.credit_limit(cgpa, semester)
     st.sidebar.info(f"📊 Your credit limit: {credit_limit} hours (based on CGPA: {cgpa})")
+with st.sidebar.expander("📏 Credit limit policy"):
+    for line in policy.describe_tiers():
+        st.write(f"- {line}")
 
 # Show test case button
 if st.sidebar.button("🧪 Load Test Case"):
@@ -352,6 +286,21 @@ if hasattr(st.session_state, 'test_cgpa'):
     failed = st.session_state.test_failed
     st.sidebar.success("🧪 Test case loaded!")
 
+# Incremental mode keeps the last result and only re-checks courses affected by an edit. It bypasses
+# the engine pool and the answer table, so it is opt-in for students exploring what-if scenarios.
+incremental_mode = st.sidebar.checkbox("⚡ Incremental what-if mode", value=False)
+what_if_courses = []
+ranker = None
+interest = ''
+# Relevance ranking fills the credit limit with the best-matching courses first, in either mode
+if st.sidebar.checkbox("🎯 Rank by relevance"):
+    ranker = get_ranker(kb_catalog)
+    interest = st.sidebar.text_input("Interests (optional)", placeholder="e.g. cloud, security, networks")
+if incremental_mode:
+    what_if_courses = st.sidebar.multiselect(
+        "🔮 What if I pass...", options=[c for c in all_courses if c not in passed]
+    )
+
 # --------------------------
 # MAIN - RECOMMENDATION SECTION
 # --------------------------
@@ -363,14 +312,16 @@ if st.sidebar.button("Get Recommendations") or cgpa > 0:
     else:
         with st.spinner("🔄 Analyzing courses and generating recommendations..."):
             try:
-                # Create expert system instance
-                system = CourseRecommendationSystem()
-                system.load_courses_from_dataframe(kb_df)
-                
                 # Get recommendations with explanations
-                recommendations, skipped_courses, total_credits, max_credits, explanations = run_advisor(
-                    cgpa, semester, passed, failed, kb_df
-                )
+                if incremental_mode:
+                    recommendations, skipped_courses, total_credits, max_credits, explanations = run_incremental_advisor(
+                        cgpa, semester, passed, failed, kb_catalog, track, ranker, interest, policy
+                    )
+                else:
+                    recommendations, skipped_courses, total_credits, max_credits, explanations = run_advisor(
+                        cgpa, semester, passed, failed, engine_pool, track, kb_catalog, answer_table, ranker, interest,
+                        policy
+                    )
                 
                 if not recommendations:
                     st.warning("⚠️ No courses could be recommended based on your profile and university rules.")
@@ -386,12 +337,6 @@ if st.sidebar.button("Get Recommendations") or cgpa > 0:
                                     elif exp['details']['reason'] == 'previously_failed':
                                         st.warning(f"⚠️ Course previously failed - Consider retaking")
                                         st.write("**Priority:** High")
-                                    elif exp['details']['reason'] == 'track_mismatch':
-                                        st.error(f"❌ Track mismatch")
-                                        st.write(f"**Required Track:** {exp['details']['course_track']}")
-                                    elif exp['details']['reason'] == 'semester_mismatch':
-                                        st.error(f"❌ Not offered this semester")
-                                        st.write(f"**Offered in:** {exp['details']['offered_semester']}")
                                     elif exp['details']['reason'] == 'missing_prerequisites':
                                         st.error(f"❌ Missing prerequisites")
                                         st.write("**Required Courses:**")
@@ -407,6 +352,9 @@ if st.sidebar.button("Get Recommendations") or cgpa > 0:
                                         st.write(f"**Current Credits:** {exp['details']['current_credits']}")
                                         st.write(f"**Course Credits:** {exp['details']['course_credits']}")
                                         st.write(f"**Maximum Allowed:** {exp['details']['max_credits']}")
+                                    elif exp['details']['reason'] == 'time_clash':
+                                        st.error(f"❌ Every section clashes with the timetable")
+                                        st.write(f"**Clashes with:** {', '.join(exp['details']['clashes_with'])}")
                 else:
                     st.success("✅ Recommended Courses:")
                     
@@ -436,6 +384,8 @@ if st.sidebar.button("Get Recommendations") or cgpa > 0:
                                         st.write(f"- {coreq}")
                                 st.write(f"✅ **Semester match:** {exp['details']['semester_match']}")
                                 st.write(f"✅ **Track match:** {exp['details']['track_match']}")
+                                if exp['details'].get('section'):
+                                    st.write(f"✅ **Section:** {exp['details']['section']} (no timetable clash)")
                                 
                                 # Show course details
                                 course_info = kb_df[kb_df['Course Code'] == exp['code']].iloc[0]
@@ -445,6 +395,12 @@ if st.sidebar.button("Get Recommendations") or cgpa > 0:
                                     st.write(f"**Prerequisites:** {course_info['Prerequisites']}")
                                 if pd.notna(course_info['Co-requisites']) and str(course_info['Co-requisites']).strip():
                                     st.write(f"**Co-requisites:** {course_info['Co-requisites']}")
+                                if ranker is not None:
+                                    similar = ranker.similar_courses(exp['code'], k=3)
+                                    if similar:
+                                        st.write("**Similar courses:** " + ", ".join(
+                                            kb_catalog.courses[course_id]['code'] for course_id, _ in similar
+                                        ))
                     
                     # Show skipped courses with explanations (only once)
                     if skipped_courses:
@@ -457,12 +413,6 @@ if st.sidebar.button("Get Recommendations") or cgpa > 0:
                                     elif exp['details']['reason'] == 'previously_failed':
                                         st.warning(f"⚠️ Course previously failed - Consider retaking")
                                         st.write("**Priority:** High")
-                                    elif exp['details']['reason'] == 'track_mismatch':
-                                        st.error(f"❌ Track mismatch")
-                                        st.write(f"**Required Track:** {exp['details']['course_track']}")
-                                    elif exp['details']['reason'] == 'semester_mismatch':
-                                        st.error(f"❌ Not offered this semester")
-                                        st.write(f"**Offered in:** {exp['details']['offered_semester']}")
                                     elif exp['details']['reason'] == 'missing_prerequisites':
                                         st.error(f"❌ Missing prerequisites")
                                         st.write("**Required Courses:**")
@@ -478,6 +428,9 @@ if st.sidebar.button("Get Recommendations") or cgpa > 0:
                                         st.write(f"**Current Credits:** {exp['details']['current_credits']}")
                                         st.write(f"**Course Credits:** {exp['details']['course_credits']}")
                                         st.write(f"**Maximum Allowed:** {exp['details']['max_credits']}")
+                                    elif exp['details']['reason'] == 'time_clash':
+                                        st.error(f"❌ Every section clashes with the timetable")
+                                        st.write(f"**Clashes with:** {', '.join(exp['details']['clashes_with'])}")
                     
                     # Create detailed recommendations dataframe for export
                     recommended_codes = [rec['code'] for rec in recommendations]
@@ -535,9 +488,43 @@ if st.sidebar.button("Get Recommendations") or cgpa > 0:
             except Exception as e:
                 st.error(f"❌ Error generating recommendations: {e}")
                 st.exception(e)
+        
+        # Side-by-side "what if I pass X" scenarios
+        if incremental_mode and what_if_courses and 'what_if_session' in st.session_state:
+            st.subheader("🔮 What-if Comparison")
+            session = st.session_state.what_if_session
+            scenarios = {'Current': session.result}
+            scenarios.update(session.compare({f"Pass {code}": {'pass': [code]} for code in what_if_courses}))
+            for column, (name, result) in zip(st.columns(len(scenarios)), scenarios.items()):
+                with column:
+                    st.markdown(f"**{name}**")
+                    st.metric("📊 Credits", f"{result.total_credits}/{result.max_credits}")
+                    for rec in result.recommended:
+                        st.write(f"- {rec['code']} ({rec['credit_hours']})")
 
 # --------------------------
 # FOOTER
 # --------------------------
 st.markdown("---")
+pool_stats = engine_pool.metrics()
+st.caption(
+    f"🔧 Engine pool: {pool_stats['idle']}/{pool_stats['size']} idle · "
+    f"{pool_stats['checkouts']} requests · {pool_stats['timeouts']} timeouts · "
+    f"avg wait {pool_stats['average_wait'] * 1000:.1f} ms"
+)
+if answer_table is None:
+    st.caption("📚 Answer table: not built for this catalog and policy, every request runs the engine")
+else:
+    answer_stats = answer_table.stats()
+    st.caption(
+        f"📚 Answer table: {answer_stats['states']} precomputed states "
+        f"({answer_stats['one_failure_states']} one-failure) · "
+        f"{answer_stats['hit_rate']:.0%} hit rate over {answer_stats['hits'] + answer_stats['misses']} lookups"
+    )
+registry_stats = registry.stats()
+st.caption(
+    f"🗂️ Catalogs: {len(registry_stats['resident'])}/{registry_stats['registered']} resident · "
+    f"{registry_stats['resident_bytes'] / 2**20:.1f}/{registry_stats['memory_budget'] / 2**20:.0f} MB · "
+    f"{registry_stats['loads']} loads · {registry_stats['evictions']} evictions"
+)
 st.markdown("🤖 **Powered by Expert System with Experta** | 📊 **Rule-based Course Recommendation**")
\ No newline at end of file
@@ -0,0 +1,237 @@
+import hashlib
+import re
+
+# Track token that makes a course available to every program
+UNIVERSAL_TRACK = 'all'
+DEFAULT_TRACK = 'Computer Engineering'
+
+TERMS = ('fall', 'spring', 'summer')
+WEEKDAYS = ('mon', 'tue', 'wed', 'thu', 'fri', 'sat', 'sun')
+# Meeting times are rasterized onto a weekly grid of fixed-length slots
+SLOT_MINUTES = 15
+SLOTS_PER_DAY = 24 * 60 // SLOT_MINUTES
+# Offering values that stand for more than one term
+TERM_ALIASES = {
+    'both': ('fall', 'spring'),
+    'all': TERMS,
+}
+
+
+def normalize_track(track):
+    """Normalize a track name to its lookup token"""
+    track = re.sub(r'\(.*?\)', ' ', str(track or ''))
+    return ' '.join(track.lower().split())
+
+
+def parse_tracks(program_track):
+    """Parse a Program/Track value into a set of normalized track tokens"""
+    tokens = (normalize_track(part) for part in str(program_track or '').split(','))
+    return frozenset(token for token in tokens if token)
+
+
+def parse_terms(semester_offered):
+    """Parse a Semester Offered value into the set of terms it covers"""
+    terms = set()
+    for part in re.split(r'[,/&]|\band\b', str(semester_offered or '').lower()):
+        part = part.strip()
+        if part in TERMS:
+            terms.add(part)
+        else:
+            terms.update(TERM_ALIASES.get(part, ()))
+    return frozenset(terms)
+
+
+def parse_capacity(capacity):
+    """Parse a Capacity value into a seat count; blank or invalid values mean no seat limit"""
+    try:
+        seats = int(float(str(capacity).strip()))
+    except (ValueError, OverflowError):
+        return None
+    return seats if seats >= 0 else None
+
+
+def parse_credit_hours(credit_hours):
+    """Parse a Credit Hours value into a whole number; blank means 0. Whole-number floats such as
+    '3.0' are accepted, as the validator does; anything else raises ValueError"""
+    credit_hours = str(credit_hours or '').strip()
+    if not credit_hours:
+        return 0
+    try:
+        return int(credit_hours)
+    except ValueError:
+        value = float(credit_hours)
+    if not value.is_integer():
+        raise ValueError(f"Credit hours must be a whole number: {credit_hours}")
+    return int(value)
+
+
+def parse_course_list(course_string):
+    """Parse comma-separated course codes"""
+    if not course_string or course_string.strip() == '' or course_string.strip().lower() == 'none':
+        return []
+    return [code.strip() for code in course_string.split(',') if code.strip()]
+
+
+def course_from_row(row, intern=None):
+    """Build a course from one catalog CSV row; `intern` lets catalogs share equal strings"""
+    intern = intern or str
+    return {
+        'code': intern(row['Course Code'].strip()),
+        'name': intern(row['Course Name'].strip()),
+        'description': intern(row['Description'].strip()),
+        'prerequisites': [intern(code) for code in parse_course_list(row['Prerequisites'])],
+        'corequisites': [intern(code) for code in parse_course_list(row['Co-requisites'])],
+        'credit_hours': parse_credit_hours(row['Credit Hours']),
+        'semester_offered': intern(row['Semester Offered'].strip()),
+        'program_track': intern(row['Program/Track'].strip()),
+        'capacity': parse_capacity(row.get('Capacity')),
+        'meeting_times': intern((row.get('Meeting Times') or '').strip())
+    }
+
+
+def _minutes(clock):
+    """Convert an HH:MM time to minutes after midnight"""
+    hours, minutes = clock.split(':')
+    return int(hours) * 60 + int(minutes)
+
+
+def meeting_mask(day, start, end):
+    """Bitmask of the weekly timeslots covered by one meeting, e.g. ('mon', '09:00', '10:30')"""
+    first = _minutes(start) // SLOT_MINUTES
+    last = -(-_minutes(end) // SLOT_MINUTES)
+    if not 0 <= first < last <= SLOTS_PER_DAY:
+        raise ValueError(f"Invalid meeting time {start}-{end}")
+    return ((1 << (last - first)) - 1) << (WEEKDAYS.index(day) * SLOTS_PER_DAY + first)
+
+
+def parse_sections(meeting_times):
+    """Parse a Meeting Times value into (label, timeslot mask) pairs, one per section.
+
+    Sections are separated by '|' and may be labelled ("A: Mon/Wed 09:00-10:30 | B: Tue 13:00-14:30");
+    meetings within a section are separated by ';'. Raises ValueError on malformed entries.
+    """
+    if not isinstance(meeting_times, str) or not meeting_times.strip():
+        return ()
+    sections = []
+    for number, section in enumerate(meeting_times.split('|'), start=1):
+        label_match = re.match(r'\s*(\w+)\s*:\s*(?=[A-Za-z])', section)
+        label = label_match.group(1) if label_match else f"S{number}"
+        mask = 0
+        for meeting in section[label_match.end() if label_match else 0:].split(';'):
+            match = re.fullmatch(r'\s*([A-Za-z/]+)\s+(\d{1,2}:\d{2})\s*-\s*(\d{1,2}:\d{2})\s*', meeting)
+            if not match:
+                raise ValueError(f"Invalid meeting '{meeting.strip()}'")
+            for day in match.group(1).lower().split('/'):
+                if day[:3] not in WEEKDAYS:
+                    raise ValueError(f"Invalid weekday '{day}'")
+                mask |= meeting_mask(day[:3], match.group(2), match.group(3))
+        sections.append((label, mask))
+    return tuple(sections)
+
+
+class CompiledCatalog:
+    """Course catalog compiled once at load time with precomputed lookup indexes.
+
+    Courses with a blank Program/Track belong to the catalog's own program and are indexed
+    under `default_track`.
+    """
+
+    def __init__(self, courses, default_track=DEFAULT_TRACK):
+        self.courses = tuple(courses)
+        self.default_track = default_track
+        self.code_to_id = {}
+        self.track_names = {}
+        track_index = {}
+        term_index = {term: set() for term in TERMS}
+        dependents = {}
+        sections = []
+
+        for course_id, course in enumerate(self.courses):
+            self.code_to_id.setdefault(course['code'], course_id)
+            try:
+                sections.append(parse_sections(course.get('meeting_times')))
+            except ValueError:
+                # Unparseable timetables are reported by the loader and the validator; treat them as unscheduled
+                sections.append(())
+            for required in list(course['prerequisites']) + list(course['corequisites']):
+                dependents.setdefault(required, set()).add(course_id)
+            for term in parse_terms(course['semester_offered']):
+                term_index[term].add(course_id)
+            program_track = str(course['program_track'] or '').strip() or default_track
+            for part in program_track.split(','):
+                token = normalize_track(part)
+                if not token:
+                    continue
+                track_index.setdefault(token, set()).add(course_id)
+                self.track_names.setdefault(token, re.sub(r'\(.*?\)', '', part).strip())
+
+        # Inverted index: track token -> ids of the courses open to that track
+        self.track_index = {token: frozenset(ids) for token, ids in track_index.items()}
+        # Inverted index: term -> ids of the courses offered in that term
+        self.term_index = {term: frozenset(ids) for term, ids in term_index.items()}
+        # Reverse index: course code -> ids of courses listing it as a prerequisite or corequisite
+        self.dependents = {code: frozenset(ids) for code, ids in dependents.items()}
+        # Per course: (label, weekly timeslot mask) of each section; empty when unscheduled
+        self.sections = tuple(sections)
+        # Lazily filled lookup caches; entries are immutable and idempotent, so
+        # concurrent readers of a shared catalog can fill them without locking
+        self._track_eligible = {}
+        self._candidates = {}
+        self._version = None
+
+    def __len__(self):
+        return len(self.courses)
+
+    @property
+    def version(self):
+        """Content hash of the catalog, used to key caches derived from it"""
+        if self._version is None:
+            digest = hashlib.sha1(repr(self.default_track).encode('utf-8'))
+            for course in self.courses:
+                digest.update(repr(sorted(course.items())).encode('utf-8'))
+            self._version = digest.hexdigest()[:12]
+        return self._version
+
+    @property
+    def tracks(self):
+        """Display names of the program tracks found in the catalog"""
+        return sorted(name for token, name in self.track_names.items() if token != UNIVERSAL_TRACK)
+
+    def track_course_ids(self, track):
+        """Return the ids of all courses a student on the given track may take"""
+        token = normalize_track(track)
+        eligible = self._track_eligible.get(token)
+        if eligible is None:
+            eligible = self.track_index.get(token, frozenset()) | self.track_index.get(UNIVERSAL_TRACK, frozenset())
+            self._track_eligible[token] = eligible
+        return eligible
+
+    def is_track_eligible(self, course_id, track):
+        """Check if a course is open to students on the given track"""
+        return course_id in self.track_course_ids(track)
+
+    def course(self, code):
+        """Return the course with the given code, or None if it is not in the catalog"""
+        course_id = self.code_to_id.get(code)
+        return None if course_id is None else self.courses[course_id]
+
+    def dependent_ids(self, code):
+        """Return the ids of courses whose eligibility depends on the given course"""
+        return self.dependents.get(code, frozenset())
+
+    def term_course_ids(self, semester):
+        """Return the ids of all courses offered in the given term"""
+        return self.term_index.get(str(semester).strip().lower(), frozenset())
+
+    def is_semester_eligible(self, course_id, semester):
+        """Check if a course is offered in the given term"""
+        return course_id in self.term_course_ids(semester)
+
+    def candidates(self, track, semester):
+        """Return the ids of courses open to the track and offered in the term, in catalog order"""
+        key = (normalize_track(track), str(semester).strip().lower())
+        ids = self._candidates.get(key)
+        if ids is None:
+            ids = tuple(sorted(self.track_course_ids(track) & self.term_course_ids(semester)))
+            self._candidates[key] = ids
+        return ids
@@ -0,0 +1,194 @@
+import csv
+import itertools
+
+import pandas as pd
+
+from catalog import DEFAULT_TRACK, CompiledCatalog, course_from_row, parse_capacity, parse_sections
+
+CHUNK_SIZE = 10000
+
+CATALOG_COLUMNS = [
+    'Course Code', 'Course Name', 'Description', 'Prerequisites', 'Co-requisites',
+    'Credit Hours', 'Semester Offered', 'Program/Track'
+]
+OFFERING_COLUMNS = ['Course Code']
+
+
+class LoadReport:
+    """Row counts and per-row problems collected while streaming a file"""
+
+    def __init__(self, filename):
+        self.filename = filename
+        self.rows = 0
+        self.loaded = 0
+        self.duplicates = 0
+        self.errors = []
+
+    def error(self, line, code, detail):
+        """Record a rejected or adjusted row"""
+        self.errors.append({'line': line, 'code': code, 'detail': detail})
+
+    def summary(self):
+        """One-line description of the load"""
+        return (f"{self.filename}: {self.loaded} of {self.rows} rows loaded, "
+                f"{self.duplicates} duplicates, {len(self.errors)} problems")
+
+
+def catalog_frame(catalog):
+    """The catalog's courses as a table with the catalog file's columns, for display and validation.
+
+    Built from the loaded courses, so it shares their strings instead of parsing the file again.
+    """
+    return pd.DataFrame({
+        'Course Code': [course['code'] for course in catalog.courses],
+        'Course Name': [course['name'] for course in catalog.courses],
+        'Description': [course['description'] for course in catalog.courses],
+        'Prerequisites': [', '.join(course['prerequisites']) for course in catalog.courses],
+        'Co-requisites': [', '.join(course['corequisites']) for course in catalog.courses],
+        'Credit Hours': [course['credit_hours'] for course in catalog.courses],
+        'Semester Offered': [course['semester_offered'] for course in catalog.courses],
+        'Program/Track': [course['program_track'] for course in catalog.courses]
+    }, columns=CATALOG_COLUMNS)
+
+
+def read_chunks(filename, required_columns, chunksize=CHUNK_SIZE):
+    """Yield lists of (line number, row) from a CSV file, chunksize rows at a time"""
+    with open(filename, 'r', encoding='utf-8', newline='') as file:
+        reader = csv.DictReader(file)
+        reader.fieldnames = [name.strip() for name in reader.fieldnames or []]
+        missing = [column for column in required_columns if column not in reader.fieldnames]
+        if missing:
+            raise ValueError(f"{filename} is missing columns: {', '.join(missing)}")
+
+        # line_num is the physical line a row ends on, as a spreadsheet would number it
+        rows = ((reader.line_num, row) for row in reader)
+        while True:
+            chunk = list(itertools.islice(rows, chunksize))
+            if not chunk:
+                return
+            yield chunk
+
+
+def _row_problem(row):
+    """Describe a row whose shape does not match the header, or None if it is well formed"""
+    # DictReader files extra fields under None and fills missing ones with None
+    if None in row:
+        return "Row has more fields than the header"
+    if None in row.values():
+        return "Row has fewer fields than the header"
+    return None
+
+
+def _schedule_problem(row):
+    """Describe an unparseable Capacity or Meeting Times value, or None if both are usable"""
+    capacity = (row.get('Capacity') or '').strip()
+    if capacity and parse_capacity(capacity) is None:
+        return f"Invalid capacity: {capacity}"
+    try:
+        parse_sections((row.get('Meeting Times') or '').strip())
+    except ValueError as e:
+        return str(e)
+    return None
+
+
+def stream_courses(filename, report, offerings=None, intern=None, chunksize=CHUNK_SIZE):
+    """Yield typed courses from a catalog file, keeping the first row of each course code"""
+    seen = set()
+    for chunk in read_chunks(filename, CATALOG_COLUMNS, chunksize):
+        for line, row in chunk:
+            report.rows += 1
+            code = (row.get('Course Code') or '').strip()
+            problem = _row_problem(row)
+            if problem is None and not code:
+                problem = "Missing course code"
+            if problem is None and code in seen:
+                report.duplicates += 1
+                problem = "Duplicate course code; the first row is kept"
+            if problem is None:
+                try:
+                    course = course_from_row(row, intern)
+                    if course['credit_hours'] < 0:
+                        raise ValueError
+                except ValueError:
+                    problem = f"Invalid credit hours: {row['Credit Hours']}"
+            if problem is None:
+                problem = _schedule_problem(row)
+            if problem is not None:
+                report.error(line, code, problem)
+                continue
+
+            if offerings and code in offerings:
+                course.update(offerings[code])
+            seen.add(code)
+            report.loaded += 1
+            yield course
+
+
+def load_offerings(filename, report, intern=None, chunksize=CHUNK_SIZE):
+    """Read an offering file into per-course overrides of term, capacity and meeting times.
+
+    Each row is one section. Sections of the same course are combined: capacities add up
+    and meeting times become alternative sections. Returns the overrides and the line numbers
+    of each course's rows; rows only count as loaded once their course is found in the catalog.
+    """
+    intern = intern or str
+    offerings = {}
+    lines = {}
+    for chunk in read_chunks(filename, OFFERING_COLUMNS, chunksize):
+        for line, row in chunk:
+            report.rows += 1
+            code = (row.get('Course Code') or '').strip()
+            problem = _row_problem(row) if code else "Missing course code"
+            if problem is not None:
+                report.error(line, code, problem)
+                continue
+
+            problem = _schedule_problem(row)
+            if problem is not None:
+                report.error(line, code, problem)
+                continue
+            capacity = parse_capacity((row.get('Capacity') or '').strip())
+            meeting_times = (row.get('Meeting Times') or '').strip()
+
+            offering = offerings.setdefault(code, {})
+            semester = (row.get('Semester Offered') or '').strip()
+            if semester:
+                offering.setdefault('semester_offered', intern(semester))
+            if capacity is not None:
+                offering['capacity'] = offering.get('capacity', 0) + capacity
+            if meeting_times:
+                label = (row.get('Section') or '').strip()
+                section = f"{label}: {meeting_times}" if label else meeting_times
+                previous = offering.get('meeting_times')
+                offering['meeting_times'] = intern(f"{previous} | {section}" if previous else section)
+            lines.setdefault(code, []).append(line)
+    return offerings, lines
+
+
+def load_catalog_file(filename, offerings_file=None, intern=None, chunksize=CHUNK_SIZE,
+                      default_track=DEFAULT_TRACK):
+    """Stream a catalog file, and optionally its offerings, straight into a compiled catalog.
+
+    Courses without a Program/Track are indexed under `default_track`. Returns the catalog
+    and the load reports; only one chunk of raw rows is held at a time.
+    """
+    reports = []
+    offerings = None
+    if offerings_file is not None:
+        offering_report = LoadReport(offerings_file)
+        offerings, offering_lines = load_offerings(offerings_file, offering_report, intern, chunksize)
+        reports.append(offering_report)
+
+    report = LoadReport(filename)
+    catalog = CompiledCatalog(stream_courses(filename, report, offerings, intern, chunksize), default_track)
+    reports.insert(0, report)
+
+    if offerings_file is not None:
+        for code, lines in offering_lines.items():
+            if code in catalog.code_to_id:
+                offering_report.loaded += len(lines)
+            else:
+                for line in lines:
+                    offering_report.error(line, code, "Offered course is not in the catalog")
+        offering_report.errors.sort(key=lambda error: error['line'])
+    return catalog, reports
@@ -0,0 +1,201 @@
+import os
+import re
+import sys
+import threading
+import time
+from collections import OrderedDict
+
+from catalog_loader import load_catalog_file
+
+DEFAULT_CATALOG_DIR = os.getenv(
+    'CATALOG_DIR', os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data')
+)
+DEFAULT_PROGRAM = os.getenv('CATALOG_PROGRAM', 'CE_Cloud')
+# Budget for compiled catalogs (courses and indexes); objects derived from them are not charged
+DEFAULT_MEMORY_BUDGET = int(os.getenv('CATALOG_MEMORY_BUDGET_MB', 256)) * 1024 * 1024
+
+# Catalog files are named <program>_<year>.csv; files without a year are the program's only catalog.
+# A <program>_<year>.offerings.csv next to a catalog holds that term's sections and capacities.
+CATALOG_FILE = re.compile(r'^(?P<program>[^.]+?)(?:_(?P<year>\d{4}))?\.csv$')
+OFFERINGS_SUFFIX = '.offerings.csv'
+
+
+def load_catalog_csv(filename, intern=sys.intern):
+    """Stream a catalog CSV and its offerings file, if any, into a compiled catalog.
+
+    Strings are interned so catalogs share them. Returns the catalog and its load reports.
+    """
+    offerings_file = filename[:-len('.csv')] + OFFERINGS_SUFFIX
+    return load_catalog_file(filename, offerings_file if os.path.exists(offerings_file) else None, intern)
+
+
+def _deep_size(value):
+    """Bytes held by a value and everything in its nested dicts, lists, tuples and sets"""
+    size = sys.getsizeof(value)
+    if isinstance(value, dict):
+        size += sum(_deep_size(key) + _deep_size(item) for key, item in value.items())
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        size += sum(_deep_size(item) for item in value)
+    return size
+
+
+def estimate_size(catalog):
+    """Approximate bytes held by a catalog's courses and lookup indexes.
+
+    Every string and id is counted as if it were unshared. Lazily filled lookup caches are not counted.
+    """
+    return sum(_deep_size(part) for part in (
+        catalog.courses, catalog.code_to_id, catalog.track_names, catalog.track_index,
+        catalog.term_index, catalog.dependents, catalog.sections
+    ))
+
+
+class CatalogRegistry:
+    """Compiled catalogs for many programs and years, loaded on demand and kept in a memory-budgeted LRU.
+
+    The memory budget covers the compiled catalogs, courses and indexes, as measured by estimate_size.
+    Objects derived from a catalog (engine pools, answer tables, raw frames) are not charged to it,
+    but they live and die with it, so evicting a catalog releases everything built from it.
+    """
+
+    def __init__(self, catalog_dir=DEFAULT_CATALOG_DIR, memory_budget=DEFAULT_MEMORY_BUDGET, loader=load_catalog_csv):
+        self.memory_budget = memory_budget
+        self.loader = loader
+        self.files = {}
+        # Load reports of the most recent load of each catalog
+        self.reports = {}
+        self._loaded = OrderedDict()
+        # Registry key -> {name: (version, derived object)} for resident catalogs
+        self._derived = {}
+        # Registry key -> event set when an in-flight load finishes
+        self._loading = {}
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._stats = {'hits': 0, 'loads': 0, 'evictions': 0, 'load_time': 0.0}
+        if catalog_dir and os.path.isdir(catalog_dir):
+            self.discover(catalog_dir)
+
+    def discover(self, directory):
+        """Register every catalog CSV found in a directory"""
+        for name in sorted(os.listdir(directory)):
+            match = CATALOG_FILE.match(name)
+            if match:
+                self.register(match.group('program'), match.group('year'), os.path.join(directory, name))
+
+    def register(self, program, year, filename):
+        """Register the catalog file for a program and year (None for an undated catalog)"""
+        self.files[(program, year)] = filename
+
+    def programs(self):
+        """Names of all registered programs"""
+        return sorted({program for program, _ in self.files})
+
+    def years(self, program):
+        """Registered years of a program, oldest first, with an undated catalog first"""
+        return sorted((year for name, year in self.files if name == program), key=lambda y: (y is not None, y))
+
+    def _key(self, program, year):
+        """Resolve a program and year to a registry key; no year means the latest catalog"""
+        if year is None:
+            years = self.years(program)
+            if years:
+                year = years[-1]
+        if (program, year) not in self.files:
+            raise KeyError(f"No catalog registered for program '{program}'" + (f", year {year}" if year else ""))
+        return program, year
+
+    def path(self, program, year=None):
+        """File the catalog for a program and year is loaded from"""
+        return self.files[self._key(program, year)]
+
+    def get(self, program, year=None):
+        """Return the compiled catalog for a program and year, loading it if it is not resident.
+
+        Loads run outside the registry lock; concurrent requests for a catalog being loaded wait for
+        that load instead of starting another.
+        """
+        key = self._key(program, year)
+        while True:
+            with self._lock:
+                entry = self._loaded.get(key)
+                if entry is not None:
+                    self._loaded.move_to_end(key)
+                    self._stats['hits'] += 1
+                    return entry[0]
+                pending = self._loading.get(key)
+                if pending is None:
+                    pending = self._loading[key] = threading.Event()
+                    break
+            # If that load fails, the next pass retries it
+            pending.wait()
+
+        try:
+            started = time.perf_counter()
+            catalog, reports = self.loader(self.files[key])
+            size = estimate_size(catalog)
+            elapsed = time.perf_counter() - started
+        except BaseException:
+            with self._lock:
+                self._loading.pop(key).set()
+            raise
+
+        with self._lock:
+            self.reports[key] = reports
+            self._stats['loads'] += 1
+            self._stats['load_time'] += elapsed
+            self._loaded[key] = (catalog, size)
+            self._bytes += size
+            # Evict least recently used catalogs, but always keep the one just requested
+            while self._bytes > self.memory_budget and len(self._loaded) > 1:
+                evicted_key, (_, evicted_size) = self._loaded.popitem(last=False)
+                self._derived.pop(evicted_key, None)
+                self._bytes -= evicted_size
+                self._stats['evictions'] += 1
+            self._loading.pop(key).set()
+        return catalog
+
+    def derived(self, program, year, name, factory, version=None):
+        """Return an object built from a catalog by factory(catalog), kept until the catalog is evicted.
+
+        A different version (e.g. of the policy the object depends on) replaces the kept object.
+        """
+        key = self._key(program, year)
+        catalog = self.get(program, year)
+        with self._lock:
+            kept = self._derived.get(key, {}).get(name)
+        if kept is not None and kept[0] == version:
+            return kept[1]
+
+        value = factory(catalog)
+        with self._lock:
+            # Keep it only while the catalog it was built from is still the resident one
+            entry = self._loaded.get(key)
+            if entry is not None and entry[0] is catalog:
+                self._derived.setdefault(key, {})[name] = (version, value)
+        return value
+
+    def load_reports(self, program, year=None):
+        """Load reports from the most recent load of a catalog, empty if it was never loaded"""
+        return self.reports.get(self._key(program, year), [])
+
+    def evict(self, program, year=None):
+        """Drop a catalog from memory, e.g. after its file was edited"""
+        with self._lock:
+            key = self._key(program, year)
+            entry = self._loaded.pop(key, None)
+            self._derived.pop(key, None)
+            if entry is not None:
+                self._bytes -= entry[1]
+
+    def stats(self):
+        """Snapshot of residency, memory use and load/eviction counters"""
+        with self._lock:
+            stats = dict(self._stats)
+            stats['resident'] = [f"{program} {year}" if year else program for program, year in self._loaded]
+            stats['resident_bytes'] = self._bytes
+            stats['derived'] = sum(len(objects) for objects in self._derived.values())
+        stats['memory_budget'] = self.memory_budget
+        stats['registered'] = len(self.files)
+        stats['load_problems'] = sum(len(report.errors) for reports in self.reports.values() for report in reports)
+        stats['average_load_time'] = stats['load_time'] / stats['loads'] if stats['loads'] else 0.0
+        return stats
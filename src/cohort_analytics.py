@@ -0,0 +1,167 @@
+import numpy as np
+import pandas as pd
+
+from catalog import DEFAULT_TRACK
+from policy import get_policy
+
+COHORT_COLUMNS = ['Student ID', 'CGPA', 'Passed Courses', 'Failed Courses']
+BATCH_SIZE = 10000
+
+
+def codes_to_matrix(catalog, series):
+    """Turn a column of comma-separated course codes into a students x courses boolean matrix"""
+    matrix = np.zeros((len(series), len(catalog)), dtype=bool)
+    refs = series.fillna('').astype(str).str.split(',').explode().str.strip()
+    ids = refs.map(catalog.code_to_id).dropna()
+    rows = pd.Series(np.arange(len(series)), index=series.index)[ids.index].to_numpy()
+    matrix[rows, ids.astype(np.int64).to_numpy()] = True
+    return matrix
+
+
+def load_cohort_csv(catalog, filename):
+    """Load a cohort's transcripts into passed and failed matrices over the catalog's course ids"""
+    df = pd.read_csv(filename, dtype={'Student ID': str})
+    df.columns = [col.strip() for col in df.columns]
+    passed = codes_to_matrix(catalog, df['Passed Courses'])
+    failed = codes_to_matrix(catalog, df['Failed Courses'])
+    return df['Student ID'].to_numpy(), df['CGPA'].to_numpy(dtype=float), passed, failed
+
+
+def _batches(passed, failed, batch_size=BATCH_SIZE):
+    """Split in-memory cohort matrices into row batches"""
+    for start in range(0, len(passed), batch_size):
+        yield passed[start:start + batch_size], failed[start:start + batch_size]
+
+
+class CohortAnalytics:
+    """Vectorized bottleneck and unlock analysis of a cohort against one catalog"""
+
+    def __init__(self, catalog):
+        self.catalog = catalog
+        n = len(catalog)
+
+        # Prerequisite edges between catalog courses, grouped by dependent course
+        edges = [
+            (catalog.code_to_id[code], course_id)
+            for course_id, course in enumerate(catalog.courses)
+            for code in course['prerequisites'] if code in catalog.code_to_id
+        ]
+        edges = np.asarray(sorted(edges, key=lambda e: e[1]), dtype=np.int64).reshape(-1, 2)
+        self.edge_prereq, self.edge_course = edges[:, 0], edges[:, 1]
+
+        # Prerequisites that are not courses (approvals, retired codes) can never be met
+        self.unmeetable = np.array([
+            any(code not in catalog.code_to_id for code in course['prerequisites'])
+            for course in catalog.courses
+        ], dtype=bool).reshape(n)
+
+        self.downstream = self._downstream_ids()
+
+    def _downstream_ids(self):
+        """Return, for each course, the ids of every course that transitively requires it"""
+        downstream = []
+        for course in self.catalog.courses:
+            seen = set()
+            frontier = list(self.catalog.dependent_ids(course['code']))
+            while frontier:
+                course_id = frontier.pop()
+                if course_id in seen:
+                    continue
+                seen.add(course_id)
+                frontier.extend(self.catalog.dependent_ids(self.catalog.courses[course_id]['code']))
+            downstream.append(np.fromiter(sorted(seen), dtype=np.int64, count=len(seen)))
+        return downstream
+
+    def _missing_prereqs(self, passed):
+        """Boolean students x edges matrix of prerequisites not yet passed"""
+        return ~passed[:, self.edge_prereq]
+
+    def _blocked(self, unmet):
+        """Boolean students x courses matrix of courses with at least one unmet prerequisite"""
+        blocked = np.zeros((len(unmet), len(self.catalog)), dtype=bool)
+        if len(self.edge_course):
+            courses, starts = np.unique(self.edge_course, return_index=True)
+            blocked[:, courses] = np.logical_or.reduceat(unmet, starts, axis=1)
+        return blocked | self.unmeetable
+
+    def prerequisites_met(self, passed):
+        """Boolean students x courses matrix of courses whose prerequisites are all passed"""
+        return ~self._blocked(self._missing_prereqs(passed))
+
+    def course_table(self, batches, semester='Fall', track=DEFAULT_TRACK, policy=None):
+        """Aggregate per-course bottleneck and eligibility statistics over batches of students"""
+        policy = policy or get_policy()
+        n = len(self.catalog)
+        offered = np.zeros(n, dtype=bool)
+        offered[list(policy.candidates(self.catalog, track, semester))] = True
+
+        students = 0
+        passed_count = np.zeros(n, dtype=np.int64)
+        failed_count = np.zeros(n, dtype=np.int64)
+        blocked_count = np.zeros(n, dtype=np.int64)
+        blocking_count = np.zeros(n, dtype=np.int64)
+        eligible_count = np.zeros(n, dtype=np.int64)
+        delayed_enrolments = np.zeros(n, dtype=np.int64)
+
+        for passed, failed in batches:
+            students += len(passed)
+            passed_count += passed.sum(axis=0)
+            failed_count += failed.sum(axis=0)
+
+            unmet = self._missing_prereqs(passed)
+            blocked = self._blocked(unmet) & ~passed
+            blocked_count += blocked.sum(axis=0)
+
+            # A prerequisite blocks a student when it is missing for a course they still need;
+            # counted once per (student, blocked course) pair
+            blocking = unmet & ~passed[:, self.edge_course]
+            np.add.at(blocking_count, self.edge_prereq, blocking.sum(axis=0))
+
+            eligible = ~passed & ~failed & ~blocked & offered
+            eligible_count += eligible.sum(axis=0)
+
+            # Downstream courses still ahead of each student who failed a course
+            for course_id in np.flatnonzero(failed.any(axis=0)):
+                downstream = self.downstream[course_id]
+                if len(downstream):
+                    delayed_enrolments[course_id] += (~passed[failed[:, course_id]][:, downstream]).sum()
+
+        return pd.DataFrame({
+            'Course Code': [c['code'] for c in self.catalog.courses],
+            'Course Name': [c['name'] for c in self.catalog.courses],
+            'Passed': passed_count,
+            'Failed': failed_count,
+            'Blocked Students': blocked_count,
+            'Blocking Count': blocking_count,
+            'Eligible Next Term': eligible_count,
+            'Eligible Fraction': eligible_count / max(students, 1),
+            'Downstream Courses': [len(d) for d in self.downstream],
+            'Delayed Enrolments': delayed_enrolments
+        })
+
+    def analyze(self, passed, failed, semester='Fall', track=DEFAULT_TRACK, policy=None):
+        """Run the course table over in-memory cohort matrices"""
+        return self.course_table(_batches(passed, failed), semester, track, policy)
+
+    def analyze_store(self, store, semester='Fall', track=DEFAULT_TRACK, batch_size=BATCH_SIZE, policy=None):
+        """Run the course table by streaming students from a transcript store"""
+        if store.course_codes != [course['code'] for course in self.catalog.courses]:
+            raise ValueError("Transcript store does not match this catalog's course ids")
+        return self.course_table(store.batches(batch_size), semester, track, policy)
+
+
+def bottlenecks(table, top=10):
+    """Courses that block the most students"""
+    return table.sort_values('Blocking Count', ascending=False).head(top)
+
+
+def failure_cascades(table, top=10):
+    """Failed courses with the largest downstream impact"""
+    return table[table['Failed'] > 0].sort_values('Delayed Enrolments', ascending=False).head(top)
+
+
+def export_tables(table, prefix):
+    """Write the full course table and its summaries as CSV files"""
+    table.to_csv(f"{prefix}_courses.csv", index=False)
+    bottlenecks(table).to_csv(f"{prefix}_bottlenecks.csv", index=False)
+    failure_cascades(table).to_csv(f"{prefix}_failure_cascades.csv", index=False)
@@ -0,0 +1,60 @@
+import queue
+import threading
+import time
+from contextlib import contextmanager
+
+DEFAULT_POOL_SIZE = 4
+DEFAULT_TIMEOUT = 5.0
+
+
+class EnginePool:
+    """Fixed-size pool of pre-initialized knowledge engines with the catalog already loaded"""
+
+    def __init__(self, factory, size=DEFAULT_POOL_SIZE, timeout=DEFAULT_TIMEOUT):
+        self.size = size
+        self.timeout = timeout
+        # LIFO hands out the most recently used engine, which is the warmest
+        self._idle = queue.LifoQueue()
+        self._lock = threading.Lock()
+        self._in_use = 0
+        self._stats = {'checkouts': 0, 'timeouts': 0, 'peak_in_use': 0, 'total_wait': 0.0}
+
+        for _ in range(size):
+            engine = factory()
+            engine.reset()
+            self._idle.put(engine)
+
+    @contextmanager
+    def engine(self, timeout=None):
+        """Check out an engine for one request and reset it when it is returned"""
+        started = time.perf_counter()
+        try:
+            engine = self._idle.get(timeout=self.timeout if timeout is None else timeout)
+        except queue.Empty:
+            with self._lock:
+                self._stats['timeouts'] += 1
+            raise TimeoutError(f"No engine available within {self.timeout if timeout is None else timeout}s")
+
+        with self._lock:
+            self._in_use += 1
+            self._stats['checkouts'] += 1
+            self._stats['total_wait'] += time.perf_counter() - started
+            self._stats['peak_in_use'] = max(self._stats['peak_in_use'], self._in_use)
+        try:
+            yield engine
+        finally:
+            # Clear facts and per-run state before anyone else can see the engine
+            engine.reset()
+            with self._lock:
+                self._in_use -= 1
+            self._idle.put(engine)
+
+    def metrics(self):
+        """Snapshot of pool size and usage counters"""
+        with self._lock:
+            stats = dict(self._stats)
+            stats['in_use'] = self._in_use
+        stats['size'] = self.size
+        stats['idle'] = self._idle.qsize()
+        stats['average_wait'] = stats['total_wait'] / stats['checkouts'] if stats['checkouts'] else 0.0
+        return stats
@@ -1,6 +1,11 @@
-import csv
+import sys
 from experta import *
 import re
+from catalog import CompiledCatalog, DEFAULT_TRACK, parse_course_list
+from catalog_loader import load_catalog_file
+from recommender import make_profile, recommend
+from policy import get_policy
+from catalog_registry import CatalogRegistry, DEFAULT_PROGRAM
 
 class StudentInfo(Fact):
     """Fact to store student information"""
@@ -18,161 +23,76 @@ class CourseRecommendationSystem(KnowledgeEngine):
     def __init__(self):
         super().__init__()
         self.courses = []
+        self.catalog = CompiledCatalog([])
+        self.load_reports = []
         self.recommended_courses = []
         self.total_credits = 0
         self.max_credits = 0
         self.student_data = {}
         self.skipped_courses = []
+        # Policy resolved for the current run
+        self.policy = None
         
-    def load_courses_from_csv(self, filename):
-        """Load courses from CSV file"""
+    def load_courses_from_csv(self, filename, offerings_file=None):
+        """Load courses from CSV file, skipping and reporting rows that cannot be used"""
         try:
-            with open(filename, 'r', encoding='utf-8') as file:
-                reader = csv.DictReader(file)
-                for row in reader:
-                    # Clean and process the data
-                    course = {
-                        'code': row['Course Code'].strip(),
-                        'name': row['Course Name'].strip(),
-                        'description': row['Description'].strip(),
-                        'prerequisites': self._parse_course_list(row['Prerequisites']),
-                        'corequisites': self._parse_course_list(row['Co-requisites']),
-                        'credit_hours': int(row['Credit Hours']) if row['Credit Hours'].strip() else 0,
-                        'semester_offered': row['Semester Offered'].strip(),
-                        'program_track': row['Program/Track'].strip()
-                    }
-                    self.courses.append(course)
-        except FileNotFoundError:
-            print(f"Error: File '{filename}' not found.")
+            self.catalog, self.load_reports = load_catalog_file(filename, offerings_file)
+        except FileNotFoundError as e:
+            print(f"Error: File '{e.filename}' not found.")
             return False
-        except Exception as e:
+        except ValueError as e:
             print(f"Error loading CSV: {e}")
             return False
+        self.courses = list(self.catalog.courses)
+        
+        for report in self.load_reports:
+            for error in report.errors:
+                print(f"⚠️ {report.filename} line {error['line']} {error['code']}: {error['detail']}")
         return True
     
+    def use_catalog(self, catalog):
+        """Share an already compiled catalog instead of loading courses again"""
+        self.catalog = catalog
+        self.courses = list(catalog.courses)
+    
     def _parse_course_list(self, course_string):
         """Parse comma-separated course codes"""
-        if not course_string or course_string.strip() == '' or course_string.strip().lower() == 'none':
-            return []
-        return [code.strip() for code in course_string.split(',') if code.strip()]
-    
-    def _is_track_eligible(self, program_track):
-        """Check if course is eligible for Computer Engineering track"""
-        track_lower = program_track.lower()
-        return 'all' in track_lower or 'computer engineering' in track_lower
-    
-    def _is_semester_eligible(self, semester_offered, current_semester):
-        """Check if course is offered in current semester"""
-        return (semester_offered.lower() == current_semester.lower() or 
-                semester_offered.lower() == 'both')
+        return parse_course_list(course_string)
     
-    def _has_prerequisites(self, prerequisites, passed_courses):
-        """Check if student has completed all prerequisites"""
-        return all(prereq in passed_courses for prereq in prerequisites)
-    
-    def _has_corequisites(self, corequisites, passed_courses, current_recommendations):
-        """Check if corequisites are satisfied (passed or being taken concurrently)"""
-        for coreq in corequisites:
-            if coreq not in passed_courses and coreq not in current_recommendations:
-                return False
-        return True
+    def reset(self, **kwargs):
+        """Clear facts and per-run state so the engine can be reused"""
+        super().reset(**kwargs)
+        self.recommended_courses = []
+        self.total_credits = 0
+        self.max_credits = 0
+        self.skipped_courses = []
+        self.policy = None
     
-    @Rule(StudentInfo(cgpa=MATCH.cgpa))
-    def set_credit_limit(self, cgpa):
-        """Set maximum credit hours based on CGPA"""
-        if cgpa < 2.0:
-            self.max_credits = 12
-        elif cgpa <= 3.0:
-            self.max_credits = 15
-        else:
-            self.max_credits = 18
+    @Rule(StudentInfo(cgpa=MATCH.cgpa, semester=MATCH.semester))
+    def set_credit_limit(self, cgpa, semester):
+        """Set maximum credit hours from the policy's CGPA tiers and term maximum"""
+        self.max_credits = self.policy.credit_limit(cgpa, semester)
         
         print(f"Maximum credit hours allowed: {self.max_credits}")
     
     @Rule(StudentInfo(cgpa=MATCH.cgpa, 
                      semester=MATCH.semester, 
                      passed_courses=MATCH.passed, 
-                     failed_courses=MATCH.failed))
-    def recommend_courses(self, cgpa, semester, passed, failed):
+                     failed_courses=MATCH.failed,
+                     track=MATCH.track))
+    def recommend_courses(self, cgpa, semester, passed, failed, track):
         """Main rule to recommend courses"""
         print("\n=== COURSE ANALYSIS ===")
         
-        for course in self.courses:
-            course_code = course['code']
-            course_name = course['name']
-            credit_hours = course['credit_hours']
-            
-            # Skip if already passed
-            if course_code in passed:
-                continue
-                
-            # Skip if currently failed (might need retaking)
-            if course_code in failed:
-                self.skipped_courses.append({
-                    'code': course_code,
-                    'name': course_name,
-                    'reason': 'Course previously failed - may need retaking'
-                })
-                continue
-            
-            # Check track eligibility
-            if not self._is_track_eligible(course['program_track']):
-                self.skipped_courses.append({
-                    'code': course_code,
-                    'name': course_name,
-                    'reason': f"Track mismatch - {course['program_track']}"
-                })
-                continue
-            
-            # Check semester eligibility
-            if not self._is_semester_eligible(course['semester_offered'], semester):
-                self.skipped_courses.append({
-                    'code': course_code,
-                    'name': course_name,
-                    'reason': f"Not offered in {semester} semester"
-                })
-                continue
-            
-            # Check prerequisites
-            if not self._has_prerequisites(course['prerequisites'], passed):
-                missing_prereqs = [p for p in course['prerequisites'] if p not in passed]
-                self.skipped_courses.append({
-                    'code': course_code,
-                    'name': course_name,
-                    'reason': f"Missing prerequisites: {', '.join(missing_prereqs)}"
-                })
-                continue
-            
-            # Check corequisites
-            current_recommendation_codes = [r['code'] for r in self.recommended_courses]
-            if not self._has_corequisites(course['corequisites'], passed, current_recommendation_codes):
-                missing_coreqs = [c for c in course['corequisites'] 
-                                if c not in passed and c not in current_recommendation_codes]
-                self.skipped_courses.append({
-                    'code': course_code,
-                    'name': course_name,
-                    'reason': f"Missing corequisites: {', '.join(missing_coreqs)}"
-                })
-                continue
-            
-            # Check credit limit
-            if self.total_credits + credit_hours > self.max_credits:
-                self.skipped_courses.append({
-                    'code': course_code,
-                    'name': course_name,
-                    'reason': f"Would exceed credit limit ({self.total_credits + credit_hours} > {self.max_credits})"
-                })
-                continue
-            
-            # Course is eligible - add to recommendations
-            self.recommended_courses.append({
-                'code': course_code,
-                'name': course_name,
-                'credit_hours': credit_hours
-            })
-            self.total_credits += credit_hours
-            
-            print(f"✓ RECOMMENDED: {course_code} - {course_name} ({credit_hours} credits)")
+        # The shared stateless core does the work; the engine only keeps the outcome
+        result = recommend(self.catalog, make_profile(cgpa, semester, passed, failed, track), self.policy)
+        self.recommended_courses = result.recommended
+        self.skipped_courses = result.skipped
+        self.total_credits = result.total_credits
+        self.max_credits = result.max_credits
+        
+        for course in result.recommended:
+            print(f"✓ RECOMMENDED: {course['code']} - {course['name']} ({course['credit_hours']} credits)")
     
     def get_student_input(self):
         """Get student information from user input"""
@@ -207,32 +127,37 @@ class CourseRecommendationSystem(KnowledgeEngine):
         failed_input = input().strip()
         failed_courses = [course.strip() for course in failed_input.split(',') if course.strip()] if failed_input else []
         
-        return cgpa, semester, passed_courses, failed_courses
+        # Get program track
+        if self.catalog.tracks:
+            print(f"\nAvailable tracks: {', '.join(self.catalog.tracks)}")
+        track = input(f"Enter your program track (press Enter for {DEFAULT_TRACK}): ").strip() or DEFAULT_TRACK
+        
+        return cgpa, semester, passed_courses, failed_courses, track
     
-    def run_recommendation(self, cgpa=None, semester=None, passed_courses=None, failed_courses=None):
+    def run_recommendation(self, cgpa=None, semester=None, passed_courses=None, failed_courses=None,
+                           track=DEFAULT_TRACK, policy=None):
         """Run the recommendation system"""
-        # Reset state
-        self.recommended_courses = []
-        self.total_credits = 0
-        self.max_credits = 0
-        self.skipped_courses = []
-        
         # Get input from user or use provided parameters
         if cgpa is None:
-            cgpa, semester, passed_courses, failed_courses = self.get_student_input()
+            cgpa, semester, passed_courses, failed_courses, track = self.get_student_input()
         
         print(f"\n=== STUDENT PROFILE ===")
         print(f"CGPA: {cgpa}")
         print(f"Semester: {semester}")
+        print(f"Track: {track}")
         print(f"Passed Courses: {passed_courses}")
         print(f"Failed Courses: {failed_courses}")
         
-        # Declare facts
+        # Clear facts and state left over from a previous run, then declare facts
+        self.reset()
+        # Resolve the policy once; every rule of this run reads the same one
+        self.policy = policy or get_policy()
         self.declare(StudentInfo(
             cgpa=cgpa,
             semester=semester,
             passed_courses=passed_courses,
-            failed_courses=failed_courses
+            failed_courses=failed_courses,
+            track=track
         ))
         
         # Run the engine
@@ -259,15 +184,25 @@ class CourseRecommendationSystem(KnowledgeEngine):
                 print(f"• {course['code']} - {course['name']}")
                 print(f"  Reason: {course['reason']}")
 
-def run_test_case():
+def load_system(program=DEFAULT_PROGRAM, year=None, registry=None):
+    """Create an engine using the registered catalog for a program and year"""
+    registry = registry or CatalogRegistry()
+    try:
+        catalog = registry.get(program, year)
+    except (KeyError, OSError, ValueError) as e:
+        print(f"Failed to load course data: {e}")
+        return None
+    system = CourseRecommendationSystem()
+    system.use_catalog(catalog)
+    return system
+
+def run_test_case(system=None):
     """Run the test case as specified"""
     print("=== RUNNING TEST CASE ===")
-    system = CourseRecommendationSystem()
-    
-    # Load courses from CSV
-    if not system.load_courses_from_csv('CE_Cloud.csv'):
-        print("Failed to load course data")
-        return
+    if system is None:
+        system = load_system()
+        if system is None:
+            return
     
     # Run test case
     system.run_recommendation(
@@ -279,14 +214,14 @@ def run_test_case():
 
 def main():
     """Main function"""
-    system = CourseRecommendationSystem()
-    
-    # Load courses from CSV
-    if not system.load_courses_from_csv('CE_Cloud.csv'):
-        print("Failed to load course data")
+    # Optional command-line catalog selection: inference_engine.py [program] [year]
+    program = sys.argv[1] if len(sys.argv) > 1 else DEFAULT_PROGRAM
+    year = sys.argv[2] if len(sys.argv) > 2 else None
+    system = load_system(program, year)
+    if system is None:
         return
     
-    print(f"Loaded {len(system.courses)} courses from CSV file.\n")
+    print(f"Loaded {len(system.courses)} courses for {program}{f' {year}' if year else ''}.\n")
     
     while True:
         print("\n" + "="*50)
@@ -299,7 +234,8 @@ def main():
         if choice == '1':
             system.run_recommendation()
         elif choice == '2':
-            run_test_case()
+            # Reuse the loaded engine; run_recommendation resets it first
+            run_test_case(system)
         elif choice == '3':
             print("Goodbye!")
             break
@@ -0,0 +1,121 @@
+import re
+
+import numpy as np
+import pandas as pd
+
+from catalog import normalize_track, parse_terms, parse_tracks, DEFAULT_TRACK, UNIVERSAL_TRACK
+
+PAGE_SIZE = 20
+
+
+def _tokens(text):
+    """Split free text into lowercase search tokens"""
+    return re.findall(r'[a-z0-9]+', str(text).lower())
+
+
+def _as_arrays(index):
+    """Freeze an index of row lists into numpy arrays"""
+    return {key: np.asarray(rows, dtype=np.int64) for key, rows in index.items()}
+
+
+class CatalogBrowser:
+    """Search and page through a knowledge base DataFrame using indexes built once.
+
+    Rows with a blank Program/Track are indexed under `default_track`, as in the compiled catalog.
+    """
+
+    def __init__(self, df, default_track=DEFAULT_TRACK):
+        self.df = df.reset_index(drop=True)
+        n = len(self.df)
+        codes = self.df['Course Code'].fillna('').astype(str).str.strip().str.upper().to_numpy()
+
+        # Sorted code index for prefix lookups
+        self._code_order = np.argsort(codes, kind='stable')
+        self._sorted_codes = codes[self._code_order]
+
+        self._credits = pd.to_numeric(self.df['Credit Hours'], errors='coerce').to_numpy()
+
+        keyword_index = {}
+        track_index = {}
+        term_index = {}
+        prereq_index = {}
+        track_tokens = {}
+        offered_terms = {}
+        text = self.df['Course Name'].fillna('').astype(str) + ' ' + self.df['Description'].fillna('').astype(str)
+        columns = zip(text, self.df['Program/Track'], self.df['Semester Offered'], self.df['Prerequisites'])
+        for row, (words, tracks, terms, prereqs) in enumerate(columns):
+            for token in set(_tokens(words)):
+                keyword_index.setdefault(token, []).append(row)
+            tracks = tracks if pd.notna(tracks) and str(tracks).strip() else default_track
+            if tracks not in track_tokens:
+                track_tokens[tracks] = parse_tracks(tracks)
+            for token in track_tokens[tracks]:
+                track_index.setdefault(token, []).append(row)
+            terms = terms if pd.notna(terms) else ''
+            if terms not in offered_terms:
+                offered_terms[terms] = parse_terms(terms)
+            for term in offered_terms[terms]:
+                term_index.setdefault(term, []).append(row)
+            for code in str(prereqs if pd.notna(prereqs) else '').split(','):
+                if code.strip():
+                    prereq_index.setdefault(code.strip().upper(), []).append(row)
+
+        self._keyword_index = _as_arrays(keyword_index)
+        self._track_index = _as_arrays(track_index)
+        self._term_index = _as_arrays(term_index)
+        self._prereq_index = _as_arrays(prereq_index)
+        self._size = n
+
+    def __len__(self):
+        return self._size
+
+    def _mask(self, rows):
+        """Turn an array of row positions into a boolean row mask"""
+        mask = np.zeros(self._size, dtype=bool)
+        mask[rows] = True
+        return mask
+
+    def prefix_rows(self, prefix):
+        """Return the rows whose course code starts with the given prefix"""
+        prefix = prefix.strip().upper()
+        lo = np.searchsorted(self._sorted_codes, prefix, side='left')
+        hi = np.searchsorted(self._sorted_codes, prefix + '\uffff', side='left')
+        return np.sort(self._code_order[lo:hi])
+
+    def keyword_rows(self, keywords):
+        """Return the rows whose name or description contains every keyword"""
+        rows = None
+        for token in _tokens(keywords):
+            hits = self._keyword_index.get(token, np.empty(0, dtype=np.int64))
+            rows = hits if rows is None else np.intersect1d(rows, hits, assume_unique=True)
+        return np.arange(self._size) if rows is None else rows
+
+    def search(self, code_prefix=None, keywords=None, track=None, semester=None,
+               credit_hours=None, prerequisite=None):
+        """Return the row positions matching every given filter, in catalog order"""
+        empty = np.empty(0, dtype=np.int64)
+        mask = np.ones(self._size, dtype=bool)
+        if code_prefix:
+            mask &= self._mask(self.prefix_rows(code_prefix))
+        if keywords:
+            mask &= self._mask(self.keyword_rows(keywords))
+        if track:
+            mask &= self._mask(self._track_index.get(normalize_track(track), empty)) | \
+                    self._mask(self._track_index.get(UNIVERSAL_TRACK, empty))
+        if semester:
+            mask &= self._mask(self._term_index.get(semester.strip().lower(), empty))
+        if credit_hours is not None:
+            mask &= self._credits == credit_hours
+        if prerequisite:
+            mask &= self._mask(self._prereq_index.get(prerequisite.strip().upper(), empty))
+        return np.flatnonzero(mask)
+
+    def page(self, rows, page=0, page_size=PAGE_SIZE):
+        """Return only the DataFrame rows on the requested page"""
+        start = page * page_size
+        return self.df.iloc[rows[start:start + page_size]]
+
+
+def page_count(total, page_size=PAGE_SIZE):
+    """Number of pages needed to show the given number of rows"""
+    return max(1, -(-total // page_size))
@@ -0,0 +1,245 @@
+import numpy as np
+import pandas as pd
+
+from catalog import DEFAULT_TRACK, TERMS, parse_terms, parse_sections
+
+# Requirement entries that are approvals rather than course codes
+NON_COURSE_REQUIREMENTS = {'department approval'}
+
+# First digit of a three-digit course number is the study year the course belongs to
+COURSE_LEVEL = r'^[A-Za-z]+(\d)\d{2}$'
+
+# Checks that block a save; everything else is reported as a warning
+ERROR_CHECKS = {'missing_code', 'duplicate_code', 'prerequisite_cycle', 'invalid_credit_hours'}
+
+FINDING_COLUMNS = ['check', 'severity', 'code', 'detail']
+
+
+def _finding(check, code, detail):
+    """Build one machine-readable validation finding"""
+    return {
+        'check': check,
+        'severity': 'error' if check in ERROR_CHECKS else 'warning',
+        'code': code,
+        'detail': detail
+    }
+
+
+def _requirement_edges(df, codes, column):
+    """Explode a comma-separated requirement column into (course row, required code) pairs"""
+    values = df[column]
+    values = values[values.notna()].astype(str)
+    rows = values.index.to_numpy()
+    values = values.tolist()
+    if not values:
+        return pd.DataFrame({'row': np.empty(0, dtype=np.int64), 'code': [], 'required': []})
+
+    # Split every cell in one pass and repeat each row id once per reference
+    refs = [ref.strip() for ref in ','.join(values).split(',')]
+    rows = np.repeat(rows, [value.count(',') + 1 for value in values])
+    skip = NON_COURSE_REQUIREMENTS | {'', 'none'}
+    keep = np.fromiter((ref.lower() not in skip for ref in refs), dtype=bool, count=len(refs))
+
+    rows = rows[keep]
+    required = np.asarray(refs, dtype=object)[keep]
+    return pd.DataFrame({'row': rows, 'code': codes.to_numpy()[rows], 'required': required})
+
+
+def _peel(n, src, dst):
+    """Boolean mask of the nodes left after repeatedly peeling sources and sinks; every node on a
+    cycle survives, but so may nodes on paths between cycles"""
+    alive = np.ones(n, dtype=bool)
+    live_edges = np.ones(len(src), dtype=bool)
+    while True:
+        indegree = np.bincount(dst[live_edges], minlength=n)
+        outdegree = np.bincount(src[live_edges], minlength=n)
+        peel = alive & ((indegree == 0) | (outdegree == 0))
+        if not peel.any():
+            return alive
+        alive &= ~peel
+        live_edges &= alive[src] & alive[dst]
+
+
+def _cycle_members(n, src, dst):
+    """Return the nodes on a directed cycle: members of strongly connected components with
+    more than one node, or with a self-loop.
+
+    Vectorized peeling shrinks the graph to its cyclic core first, so the iterative Tarjan pass
+    only walks the few courses that can be on a cycle.
+    """
+    src = np.asarray(src, dtype=np.int64)
+    dst = np.asarray(dst, dtype=np.int64)
+    alive = _peel(n, src, dst)
+    nodes = np.flatnonzero(alive)
+    if not len(nodes):
+        return nodes
+    # Relabel the remaining nodes 0..k-1 and keep only the edges between them
+    label = np.full(n, -1, dtype=np.int64)
+    label[nodes] = np.arange(len(nodes))
+    inside = alive[src] & alive[dst]
+    members = _strongly_connected_members(len(nodes), label[src[inside]], label[dst[inside]])
+    return nodes[members]
+
+
+def _strongly_connected_members(n, src, dst):
+    """Nodes in strongly connected components with more than one node, or with a self-loop
+    (iterative Tarjan)"""
+    order = np.argsort(src, kind='stable')
+    targets = dst[order].tolist()
+    starts = np.searchsorted(src[order], np.arange(n + 1)).tolist()
+
+    index = [-1] * n
+    lowlink = [0] * n
+    on_stack = [False] * n
+    stack = []
+    members = []
+    counter = 0
+    for root in range(n):
+        if index[root] >= 0:
+            continue
+        # Each frame is (node, position of the next outgoing edge to visit)
+        frames = [(root, starts[root])]
+        index[root] = lowlink[root] = counter
+        counter += 1
+        stack.append(root)
+        on_stack[root] = True
+        while frames:
+            node, edge = frames[-1]
+            if edge < starts[node + 1]:
+                frames[-1] = (node, edge + 1)
+                target = targets[edge]
+                if index[target] < 0:
+                    index[target] = lowlink[target] = counter
+                    counter += 1
+                    stack.append(target)
+                    on_stack[target] = True
+                    frames.append((target, starts[target]))
+                elif on_stack[target]:
+                    lowlink[node] = min(lowlink[node], index[target])
+                continue
+
+            frames.pop()
+            if frames:
+                parent = frames[-1][0]
+                lowlink[parent] = min(lowlink[parent], lowlink[node])
+            if lowlink[node] == index[node]:
+                component = []
+                while True:
+                    member = stack.pop()
+                    on_stack[member] = False
+                    component.append(member)
+                    if member == node:
+                        break
+                if len(component) > 1:
+                    members.extend(component)
+
+    self_loops = src[src == dst].tolist()
+    return np.unique(np.array(members + self_loops, dtype=np.int64))
+
+
+def validate_catalog(df):
+    """Check the whole knowledge base in one pass and return a list of findings"""
+    findings = []
+    if df.empty:
+        return findings
+
+    df = df.reset_index(drop=True)
+    codes = df['Course Code'].fillna('').astype(str).str.strip()
+
+    # Missing and duplicate course codes
+    for row in np.flatnonzero(codes.to_numpy() == ''):
+        findings.append(_finding('missing_code', '', f"Row {row + 1} has no course code"))
+    duplicated = codes[(codes != '') & codes.duplicated(keep=False)]
+    for code, count in duplicated.value_counts(sort=False).items():
+        findings.append(_finding('duplicate_code', code, f"Course code appears {count} times"))
+
+    # Credit hours must be non-negative whole numbers; blank means 0, as in the loader
+    raw_credits = df['Credit Hours']
+    blank_credits = raw_credits.isna() | raw_credits.astype(str).str.strip().eq('')
+    credits = pd.to_numeric(raw_credits.where(~blank_credits, 0), errors='coerce')
+    bad_credits = credits.isna() | (credits < 0) | (credits % 1 != 0)
+    for row in np.flatnonzero(bad_credits.to_numpy()):
+        findings.append(_finding('invalid_credit_hours', codes[row],
+                                 f"Invalid credit hours: {df.at[row, 'Credit Hours']}"))
+
+    # Resolve requirement references against the first row of each code
+    first_row = pd.Series(np.arange(len(codes)), index=codes)
+    first_row = first_row[~first_row.index.duplicated()]
+    terms = df['Semester Offered'].fillna('').astype(str)
+    term_sets = {value: parse_terms(value) for value in terms.unique()}
+    offered = terms.map({value: bool(covered) for value, covered in term_sets.items()}).to_numpy()
+    # Position in the academic year (fall, spring, summer) of the first and last term each course is offered
+    first_term = terms.map({value: min(map(TERMS.index, covered), default=-1)
+                            for value, covered in term_sets.items()}).to_numpy()
+    last_term = terms.map({value: max(map(TERMS.index, covered), default=-1)
+                           for value, covered in term_sets.items()}).to_numpy()
+    # Study year from the course number, e.g. 2 for MAT212; -1 when the code has no three-digit number
+    level = pd.to_numeric(codes.str.extract(COURSE_LEVEL, expand=False), errors='coerce').fillna(-1).to_numpy()
+
+    for column, kind in (('Prerequisites', 'prerequisite'), ('Co-requisites', 'corequisite')):
+        edges = _requirement_edges(df, codes, column)
+        required_row = edges['required'].map(first_row)
+        dangling = edges[required_row.isna()]
+        for code, required in zip(dangling['code'], dangling['required']):
+            findings.append(_finding(f'dangling_{kind}', code, f"Unknown {kind} '{required}'"))
+
+        # A requirement that is never offered makes an offered course impossible to take
+        resolved = edges[required_row.notna()]
+        required_row = required_row.dropna().astype(int).to_numpy()
+        never_offered = offered[resolved['row'].to_numpy()] & ~offered[required_row]
+        for code, required in zip(resolved['code'][never_offered], resolved['required'][never_offered]):
+            findings.append(_finding(f'{kind}_not_offered', code,
+                                     f"{kind.capitalize()} '{required}' is not offered in any semester"))
+
+        # Terms repeat every year, so a requirement offered later in the year is only a problem when
+        # both courses belong to the same study year: the plan then puts the dependent first
+        rows = resolved['row'].to_numpy()
+        offered_after = (offered[rows] & offered[required_row] & (level[rows] >= 0)
+                         & (level[rows] == level[required_row]) & (first_term[required_row] > last_term[rows]))
+        for code, required in zip(resolved['code'][offered_after], resolved['required'][offered_after]):
+            findings.append(_finding(f'{kind}_offered_after', code,
+                                     f"{kind.capitalize()} '{required}' is only offered after {code} "
+                                     f"in the same study year"))
+
+        if kind == 'prerequisite':
+            cycle_rows = _cycle_members(len(codes), required_row, rows)
+            for row in cycle_rows:
+                findings.append(_finding('prerequisite_cycle', codes[row],
+                                         "Course is part of a prerequisite cycle"))
+
+    # Courses without a track fall back to the catalog's default track
+    tracks = df['Program/Track'].fillna('').astype(str).str.strip()
+    for row in np.flatnonzero(((tracks == '') & (codes != '')).to_numpy()):
+        findings.append(_finding('blank_track', codes[row],
+                                 f"No Program/Track; the course is offered to the {DEFAULT_TRACK} track"))
+
+    # Meeting times are optional, but must parse when present
+    if 'Meeting Times' in df.columns:
+        for row, value in df['Meeting Times'].dropna().astype(str).items():
+            try:
+                parse_sections(value)
+            except ValueError as e:
+                findings.append(_finding('invalid_meeting_times', codes[row], str(e)))
+
+    return findings
+
+
+def findings_to_frame(findings):
+    """Return validation findings as a DataFrame for display or export"""
+    return pd.DataFrame(findings, columns=FINDING_COLUMNS)
+
+
+def has_errors(findings):
+    """Check whether any finding should block a save"""
+    return any(f['severity'] == 'error' for f in findings)
+
+
+def print_findings(findings):
+    """Print validation findings grouped by severity"""
+    if not findings:
+        print("✅ Knowledge base passed all integrity checks.")
+        return
+    for severity, icon in (('error', '❌'), ('warning', '⚠️')):
+        for f in findings:
+            if f['severity'] == severity:
+                print(f"{icon} [{f['check']}] {f['code']}: {f['detail']}")
@@ -1,17 +1,31 @@
 import pandas as pd
 import os
+import re
+from kb_validator import validate_catalog, has_errors, print_findings
+from kb_browser import CatalogBrowser, page_count
+from catalog_registry import CatalogRegistry, DEFAULT_PROGRAM
 
-# CSV file path
-KB_FILE = os.path.join(os.path.dirname(os.path.dirname(__file__)), "data", "CE_Cloud.csv")
+# Choose which registered catalog to edit
+def choose_catalog(registry):
+    catalogs = sorted(registry.files.items(), key=lambda item: (item[0][0], item[0][1] or ''))
+    if not catalogs:
+        return None
+    print("\n📂 Catalogs:")
+    for number, ((program, year), _) in enumerate(catalogs, start=1):
+        print(f"{number}. {program}{f' {year}' if year else ''}")
+    default = next((n for n, ((program, _), _) in enumerate(catalogs, start=1) if program == DEFAULT_PROGRAM), 1)
+    choice = input(f"Select a catalog (1–{len(catalogs)}, default {default}): ").strip()
+    number = int(choice) if choice.isdigit() and 1 <= int(choice) <= len(catalogs) else default
+    return catalogs[number - 1][1]
 
 # Load Knowledge Base
-def load_kb():
-    print(f"Looking for CSV file at: {KB_FILE}")
-    if os.path.exists(KB_FILE):
+def load_kb(kb_file):
+    print(f"Looking for CSV file at: {kb_file}")
+    if os.path.exists(kb_file):
         print("CSV file found!")
         try:
             # Read CSV and drop duplicates
-            df = pd.read_csv(KB_FILE)
+            df = pd.read_csv(kb_file)
             print(f"Initial DataFrame shape: {df.shape}")
             
             # Drop duplicate rows
@@ -29,6 +43,9 @@ def load_kb():
             
             print(f"Final DataFrame shape: {df.shape}")
             print(f"Columns: {df.columns.tolist()}")
+            
+            # Report integrity problems in the file as loaded
+            print_findings(validate_catalog(df))
             return df
         except Exception as e:
             print(f"Error reading CSV: {str(e)}")
@@ -46,11 +63,20 @@ def load_kb():
         ])
 
 # Save Knowledge Base
-def save_kb(df):
+def save_kb(df, kb_file):
     # Drop duplicates before saving
     df = df.drop_duplicates()
-    df.to_csv(KB_FILE, index=False)
-    print("✅ Knowledge base saved to", KB_FILE)
+    
+    # Refuse to save a catalog with integrity errors
+    findings = validate_catalog(df)
+    if has_errors(findings):
+        print_findings(findings)
+        print("❌ Knowledge base not saved. Fix the errors above first.")
+        return False
+    
+    df.to_csv(kb_file, index=False)
+    print("✅ Knowledge base saved to", kb_file)
+    return True
 
 # View Courses
 def view_courses(df):
@@ -59,9 +85,47 @@ def view_courses(df):
     print(f"Columns: {df.columns.tolist()}")
     if df.empty:
         print("\n📚 No courses found in the knowledge base.\n")
-    else:
-        print("\n📚 Current Courses:\n")
-        print(df.to_string(index=False))
+        return
+
+    browser = CatalogBrowser(df)
+    rows = browser.search()
+    page = 0
+    while True:
+        pages = page_count(len(rows))
+        print(f"\n📚 Courses (page {page + 1}/{pages}, {len(rows)} matching):\n")
+        if len(rows):
+            print(browser.page(rows, page).to_string(index=False))
+        else:
+            print("No courses match the current filters.")
+
+        action = input("\n[n]ext, [p]revious, [f]ilter, [c]lear filters, [q]uit: ").strip().lower()
+        if action == 'n' and page + 1 < pages:
+            page += 1
+        elif action == 'p' and page > 0:
+            page -= 1
+        elif action == 'f':
+            rows, page = browser.search(**prompt_filters()), 0
+        elif action == 'c':
+            rows, page = browser.search(), 0
+        elif action == 'q':
+            break
+
+# Ask for browse filters, leaving blanks unfiltered
+def prompt_filters():
+    filters = {
+        'code_prefix': input("Code prefix: ").strip(),
+        'keywords': input("Keywords in name/description: ").strip(),
+        'track': input("Track: ").strip(),
+        'semester': input("Semester (Fall/Spring/Summer): ").strip(),
+        'prerequisite': input("Has prerequisite: ").strip()
+    }
+    credit_hours = input("Credit Hours: ").strip()
+    if credit_hours:
+        try:
+            filters['credit_hours'] = int(credit_hours)
+        except ValueError:
+            print("❌ Credit hours must be an integer. Ignoring this filter.")
+    return {key: value for key, value in filters.items() if value != ''}
 
 # Add a New Course
 def add_course(df):
@@ -86,12 +150,14 @@ def add_course(df):
     semester_offered = input("Semester Offered (Fall/Spring/Both): ").strip().capitalize()
     program_track = input("Program/Track: ").strip()
 
-    # Validate prerequisites
-    existing_codes = df['Course Code'].tolist()
-    if prerequisites.lower() != 'none':
-        for pre in prerequisites.split(','):
-            if pre.strip() not in existing_codes:
-                print(f"❌ Prerequisite '{pre.strip()}' does not exist in the current knowledge base.")
+    # Validate prerequisites and co-requisites
+    existing_codes = set(df['Course Code'].dropna().astype(str).str.strip())
+    for label, requirements in (('Prerequisite', prerequisites), ('Co-requisite', corequisites)):
+        if not requirements or requirements.lower() == 'none':
+            continue
+        for req in requirements.split(','):
+            if req.strip() and req.strip() not in existing_codes:
+                print(f"❌ {label} '{req.strip()}' does not exist in the current knowledge base.")
                 return df
 
     new_course = {
@@ -142,6 +208,15 @@ def edit_course(df):
 def delete_course(df):
     code = input("Enter course code to delete: ").strip().upper()
     if code in df['Course Code'].values:
+        # Warn about courses that would be left with a dangling reference
+        pattern = rf'(?:^|,)\s*{re.escape(code)}\s*(?:,|$)'
+        refs = df[['Prerequisites', 'Co-requisites']].fillna('').astype(str)
+        dependents = df.loc[refs.apply(lambda col: col.str.contains(pattern)).any(axis=1), 'Course Code'].tolist()
+        if dependents:
+            print(f"⚠️ Required by: {', '.join(dependents)}")
+            if input("Delete anyway? (y/N): ").strip().lower() != 'y':
+                print("❌ Deletion cancelled.")
+                return df
         df = df[df['Course Code'] != code]
         print(f"✅ Course '{code}' deleted.")
     else:
@@ -150,7 +225,11 @@ def delete_course(df):
 
 # Menu
 def menu():
-    df = load_kb()
+    kb_file = choose_catalog(CatalogRegistry())
+    if kb_file is None:
+        print("❌ No catalog files found.")
+        return
+    df = load_kb(kb_file)
 
     while True:
         print("\n🔧 Knowledge Base Editor")
@@ -158,8 +237,9 @@ def menu():
         print("2. Add Course")
         print("3. Edit Course")
         print("4. Delete Course")
-        print("5. Save and Exit")
-        choice = input("Select an option (1–5): ").strip()
+        print("5. Validate Knowledge Base")
+        print("6. Save and Exit")
+        choice = input("Select an option (1–6): ").strip()
 
         if choice == '1':
             view_courses(df)
@@ -170,10 +250,12 @@ def menu():
         elif choice == '4':
             df = delete_course(df)
         elif choice == '5':
-            save_kb(df)
-            break
+            print_findings(validate_catalog(df))
+        elif choice == '6':
+            if save_kb(df, kb_file):
+                break
         else:
-            print("❌ Invalid choice. Please enter a number between 1 and 5.")
+            print("❌ Invalid choice. Please enter a number between 1 and 6.")
 
 if __name__ == "__main__":
     menu()
@@ -0,0 +1,145 @@
+import bisect
+import hashlib
+import json
+import os
+
+import numpy as np
+
+from catalog import normalize_track
+
+DEFAULT_POLICY_FILE = os.getenv(
+    'POLICY_FILE', os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data', 'policy.json')
+)
+
+# Rules used when no policy file is present; they match the shipped data/policy.json
+DEFAULT_RULES = {
+    'credit_tiers': [
+        {'max_cgpa': 2.0, 'inclusive': False, 'max_credits': 12},
+        {'max_cgpa': 3.0, 'inclusive': True, 'max_credits': 15},
+        {'max_credits': 18}
+    ],
+    'term_max_credits': {'fall': 18, 'spring': 18, 'summer': 18},
+    'shared_tracks': {},
+    'retakes': {'recommend': False, 'priority': True}
+}
+
+# Term cap used for terms the policy does not limit
+NO_TERM_CAP = np.iinfo(np.int64).max
+
+
+class Policy:
+    """Advising rules compiled into lookup tables.
+
+    Credit tiers become a sorted array of CGPA upper bounds, so one searchsorted call
+    evaluates a whole batch of students. Inclusive bounds are nudged up with nextafter,
+    which lets every tier use the same right-sided search.
+    """
+
+    def __init__(self, rules):
+        self.rules = rules
+        self.version = hashlib.sha1(json.dumps(rules, sort_keys=True).encode('utf-8')).hexdigest()[:12]
+
+        tiers = rules['credit_tiers']
+        if not tiers or tiers[-1].get('max_cgpa') is not None:
+            raise ValueError("The last credit tier must have no max_cgpa")
+        bounds = [
+            np.nextafter(float(tier['max_cgpa']), np.inf) if tier.get('inclusive') else float(tier['max_cgpa'])
+            for tier in tiers[:-1]
+        ]
+        if any(low >= high for low, high in zip(bounds, bounds[1:])):
+            raise ValueError("Credit tiers must be sorted by max_cgpa")
+        self.tier_bounds = np.array(bounds, dtype=float)
+        self.tier_credits = np.array([int(tier['max_credits']) for tier in tiers], dtype=np.int64)
+        self._bounds = self.tier_bounds.tolist()
+        self._credits = self.tier_credits.tolist()
+
+        self.term_max_credits = {
+            str(term).strip().lower(): int(cap) for term, cap in rules.get('term_max_credits', {}).items()
+        }
+
+        # Track token -> every track token whose courses it may take
+        self.shared_tracks = {
+            normalize_track(track): tuple(dict.fromkeys([normalize_track(track)] + [normalize_track(t) for t in shared]))
+            for track, shared in rules.get('shared_tracks', {}).items()
+        }
+
+        retakes = rules.get('retakes', {})
+        self.recommend_retakes = bool(retakes.get('recommend', False))
+        self.retake_priority = bool(retakes.get('priority', True))
+
+    def _term_cap(self, semester):
+        """Credit cap for a term, or NO_TERM_CAP when the term is not limited"""
+        return self.term_max_credits.get(str(semester).strip().lower(), NO_TERM_CAP)
+
+    def credit_limit(self, cgpa, semester=None):
+        """Maximum credit hours for one student"""
+        credits = self._credits[bisect.bisect_right(self._bounds, cgpa)]
+        return credits if semester is None else min(credits, self._term_cap(semester))
+
+    def credit_limits(self, cgpa, semester=None):
+        """Maximum credit hours for a batch of students; semester may be one term or one per student"""
+        limits = self.tier_credits[np.searchsorted(self.tier_bounds, np.asarray(cgpa, dtype=float), side='right')]
+        if semester is None:
+            return limits
+        if isinstance(semester, str):
+            return np.minimum(limits, self._term_cap(semester))
+        terms, inverse = np.unique(np.asarray(semester, dtype=str), return_inverse=True)
+        caps = np.array([self._term_cap(term) for term in terms], dtype=np.int64)
+        return np.minimum(limits, caps[inverse])
+
+    def describe_tiers(self):
+        """Human-readable credit tiers, in order"""
+        lines = []
+        for tier in self.rules['credit_tiers']:
+            if tier.get('max_cgpa') is None:
+                condition = "Otherwise" if lines else "Any CGPA"
+            else:
+                condition = f"CGPA {'≤' if tier.get('inclusive') else '<'} {tier['max_cgpa']}"
+            lines.append(f"{condition}: {tier['max_credits']} hours")
+        return lines
+
+    def tracks_for(self, track):
+        """Track tokens whose courses are open to a student on the given track"""
+        token = normalize_track(track)
+        return self.shared_tracks.get(token, (token,))
+
+    def candidates(self, catalog, track, semester):
+        """Ids of the courses a student on the track may take in the term, in catalog order"""
+        tracks = self.tracks_for(track)
+        if len(tracks) == 1:
+            return catalog.candidates(tracks[0], semester)
+        return tuple(sorted(set().union(*(catalog.candidates(t, semester) for t in tracks))))
+
+    def tier_cgpas(self):
+        """One CGPA inside each credit tier, the highest one where the tier has an upper bound"""
+        cgpas = [float(np.nextafter(bound, -np.inf)) for bound in self.tier_bounds]
+        return cgpas + [float(self.tier_bounds[-1]) if len(self.tier_bounds) else 0.0]
+
+    def cache_key(self, catalog):
+        """Version of results derived from this policy applied to a catalog"""
+        return f"{catalog.version}-{self.version}"
+
+
+def load_policy(filename=DEFAULT_POLICY_FILE):
+    """Compile the policy file, falling back to the built-in rules when it does not exist"""
+    if not os.path.exists(filename):
+        return Policy(DEFAULT_RULES)
+    with open(filename, 'r', encoding='utf-8') as file:
+        return Policy(json.load(file))
+
+
+# Policy file -> (modification time, compiled policy)
+_policies = {}
+
+
+def get_policy(filename=DEFAULT_POLICY_FILE):
+    """The compiled policy for a file, recompiled when the file changes"""
+    try:
+        mtime = os.path.getmtime(filename)
+    except OSError:
+        mtime = None
+    cached = _policies.get(filename)
+    if cached is None or cached[0] != mtime:
+        cached = (mtime, load_policy(filename))
+        _policies[filename] = cached
+    return cached[1]
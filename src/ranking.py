@@ -0,0 +1,129 @@
+import re
+
+import numpy as np
+
+# Words that carry no meaning for course relevance
+STOP_WORDS = {
+    'a', 'an', 'and', 'as', 'for', 'i', 'ii', 'in', 'into', 'of', 'on', 'or',
+    'the', 'to', 'with', 'course', 'introduction', 'fundamentals', 'basics'
+}
+
+# Rankers are built once per catalog version and shared
+_rankers = {}
+MAX_CACHED_RANKERS = 8
+
+
+def tokenize(text):
+    """Split text into lowercase terms, dropping stop words and numbers"""
+    return [t for t in re.findall(r'[a-z]+', str(text).lower()) if t not in STOP_WORDS and len(t) > 1]
+
+
+class CourseRanker:
+    """Content-based relevance scoring over a sparse TF-IDF matrix of course names and descriptions"""
+
+    def __init__(self, catalog):
+        self.catalog = catalog
+        self.version = catalog.version
+        self.vocabulary = {}
+
+        # Build the term-count matrix in CSR form
+        indptr = [0]
+        indices = []
+        counts = []
+        for course in catalog.courses:
+            row = {}
+            for term in tokenize(f"{course['name']} {course['description']}"):
+                term_id = self.vocabulary.setdefault(term, len(self.vocabulary))
+                row[term_id] = row.get(term_id, 0) + 1
+            indices.extend(row.keys())
+            counts.extend(row.values())
+            indptr.append(len(indices))
+
+        self.indptr = np.asarray(indptr, dtype=np.int64)
+        self.indices = np.asarray(indices, dtype=np.int64)
+        counts = np.asarray(counts, dtype=np.float64)
+        row_of = np.repeat(np.arange(len(catalog.courses)), np.diff(self.indptr))
+
+        # Sublinear TF times smoothed IDF, then L2-normalize each course row
+        doc_freq = np.bincount(self.indices, minlength=len(self.vocabulary))
+        self.idf = np.log((1 + len(catalog.courses)) / (1 + doc_freq)) + 1
+        data = (1 + np.log(counts)) * self.idf[self.indices]
+        norms = np.sqrt(np.bincount(row_of, weights=data ** 2, minlength=len(catalog.courses)))
+        norms[norms == 0] = 1
+        self.data = data / norms[row_of]
+
+    def _row_vector(self, course_id):
+        """Return the dense TF-IDF vector of one course"""
+        vector = np.zeros(len(self.vocabulary))
+        start, end = self.indptr[course_id], self.indptr[course_id + 1]
+        vector[self.indices[start:end]] = self.data[start:end]
+        return vector
+
+    def query_vector(self, passed=(), interest=''):
+        """Build a normalized query from a student's passed courses and free-text interests"""
+        query = np.zeros(len(self.vocabulary))
+        for code in passed:
+            course_id = self.catalog.code_to_id.get(code)
+            if course_id is not None:
+                query += self._row_vector(course_id)
+        for term in tokenize(interest):
+            term_id = self.vocabulary.get(term)
+            if term_id is not None:
+                # Interests outweigh any single passed course
+                query[term_id] += 2 * self.idf[term_id]
+        norm = np.linalg.norm(query)
+        return query / norm if norm else query
+
+    def scores(self, course_ids, query):
+        """Cosine similarity of the query with each of the given courses"""
+        course_ids = np.asarray(course_ids, dtype=np.int64)
+        if not len(course_ids) or not query.any():
+            return np.zeros(len(course_ids))
+        starts = self.indptr[course_ids]
+        lengths = self.indptr[course_ids + 1] - starts
+        # Gather the non-zeros of the selected rows without a Python loop
+        offsets = np.cumsum(lengths) - lengths
+        positions = np.repeat(starts - offsets, lengths) + np.arange(lengths.sum())
+        owners = np.repeat(np.arange(len(course_ids)), lengths)
+        weights = self.data[positions] * query[self.indices[positions]]
+        return np.bincount(owners, weights=weights, minlength=len(course_ids))
+
+    def rank(self, course_ids, passed=(), interest=''):
+        """Order courses by relevance, keeping catalog order among ties"""
+        course_ids = np.asarray(course_ids, dtype=np.int64)
+        scores = self.scores(course_ids, self.query_vector(passed, interest))
+        order = np.argsort(-scores, kind='stable')
+        return [int(i) for i in course_ids[order]]
+
+    def top_k(self, course_ids, query, k=5):
+        """Return the k best (course id, score) pairs using a partial sort"""
+        course_ids = np.asarray(course_ids, dtype=np.int64)
+        scores = self.scores(course_ids, query)
+        if k < len(scores):
+            best = np.argpartition(-scores, k)[:k]
+        else:
+            best = np.arange(len(scores))
+        best = best[np.argsort(-scores[best], kind='stable')]
+        return [(int(course_ids[i]), float(scores[i])) for i in best if scores[i] > 0]
+
+    def recommend_relevant(self, course_ids, passed=(), interest='', k=5):
+        """Return the k eligible courses most relevant to a student's profile or interests"""
+        return self.top_k(course_ids, self.query_vector(passed, interest), k)
+
+    def similar_courses(self, code, k=5):
+        """Return the k courses most similar to the given course"""
+        course_id = self.catalog.code_to_id.get(code)
+        if course_id is None:
+            return []
+        others = np.delete(np.arange(len(self.catalog.courses)), course_id)
+        return self.top_k(others, self._row_vector(course_id), k)
+
+
+def get_ranker(catalog):
+    """Return the ranker for a catalog, building it once per catalog version"""
+    ranker = _rankers.get(catalog.version)
+    if ranker is None:
+        if len(_rankers) >= MAX_CACHED_RANKERS:
+            _rankers.pop(next(iter(_rankers)))
+        ranker = _rankers[catalog.version] = CourseRanker(catalog)
+    return ranker
@@ -0,0 +1,202 @@
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+from catalog import DEFAULT_TRACK
+from policy import get_policy
+
+RecommendationResult = namedtuple(
+    'RecommendationResult',
+    ['recommended', 'skipped', 'total_credits', 'max_credits', 'explanations']
+)
+
+StudentProfile = namedtuple('StudentProfile', ['cgpa', 'semester', 'passed', 'failed', 'track'])
+
+# Per-course eligibility states computed before credit packing
+ALREADY_PASSED = ('already_passed', ())
+PREVIOUSLY_FAILED = ('previously_failed', ())
+RETAKE = ('retake', ())
+ELIGIBLE = ('eligible', ())
+
+
+def make_profile(cgpa, semester, passed=(), failed=(), track=DEFAULT_TRACK):
+    """Build an immutable student profile"""
+    return StudentProfile(cgpa, semester, frozenset(passed), frozenset(failed), track)
+
+
+def evaluate_course(course, passed, failed, retakes=False):
+    """Return the eligibility state of a course that does not depend on the other recommendations"""
+    if course['code'] in passed:
+        return ALREADY_PASSED
+    failed_before = course['code'] in failed
+    if failed_before and not retakes:
+        return PREVIOUSLY_FAILED
+    missing = tuple(p for p in course['prerequisites'] if p not in passed)
+    if missing:
+        return ('missing_prerequisites', missing)
+    return RETAKE if failed_before else ELIGIBLE
+
+
+def evaluate_candidates(catalog, candidate_ids, passed, failed, retakes=False):
+    """Evaluate the eligibility state of every candidate course"""
+    return {
+        course_id: evaluate_course(catalog.courses[course_id], passed, failed, retakes)
+        for course_id in candidate_ids
+    }
+
+
+def packing_order(candidate_ids, states, policy):
+    """Move retakes to the front when the policy gives them priority"""
+    if not (policy.recommend_retakes and policy.retake_priority):
+        return candidate_ids
+    retakes = [course_id for course_id in candidate_ids if states[course_id] is RETAKE]
+    if not retakes:
+        return candidate_ids
+    return retakes + [course_id for course_id in candidate_ids if states[course_id] is not RETAKE]
+
+
+def _restriction(course, reason, details=None):
+    """Build the explanation entry for a course that is not recommended"""
+    return {
+        'code': course['code'],
+        'name': course['name'],
+        'type': 'restricted',
+        'details': {'reason': reason, **(details or {})}
+    }
+
+
+def _skip(course, reason):
+    """Build the skipped-course entry shown to the student"""
+    return {'code': course['code'], 'name': course['name'], 'reason': reason}
+
+
+def restriction(course, state):
+    """Return the (explanation, skipped entry or None) of a course ruled out by its state alone.
+
+    Returns None for eligible courses and retakes, which are decided while packing.
+    """
+    status, missing = state
+    if status == 'already_passed':
+        return _restriction(course, 'already_passed', {
+            'semester_passed': 'Previously completed'
+        }), None
+
+    if status == 'previously_failed':
+        return _restriction(course, 'previously_failed', {
+            'priority': 'high',
+            'action_needed': 'Consider retaking'
+        }), _skip(course, 'Course previously failed - may need retaking')
+
+    if status == 'missing_prerequisites':
+        return _restriction(course, 'missing_prerequisites', {
+            'missing_courses': list(missing),
+            'required_courses': course['prerequisites']
+        }), _skip(course, f"Missing prerequisites: {', '.join(missing)}")
+
+    return None
+
+
+def pack_courses(catalog, candidate_ids, states, passed, max_credits):
+    """Pack eligible candidates into a clash-free schedule under the credit limit, in the given order"""
+    recommended = []
+    recommended_codes = set()
+    # Timeslots taken so far, and the (code, mask) of each booked section for clash reports
+    occupied = 0
+    booked = []
+    skipped = []
+    explanations = []
+    total_credits = 0
+
+    for course_id in candidate_ids:
+        course = catalog.courses[course_id]
+        status = states[course_id][0]
+
+        ruled_out = restriction(course, states[course_id])
+        if ruled_out is not None:
+            explanation, skip = ruled_out
+            explanations.append(explanation)
+            if skip is not None:
+                skipped.append(skip)
+            continue
+
+        # Corequisites may be satisfied by a course recommended earlier in the pass
+        missing_coreqs = [c for c in course['corequisites'] if c not in passed and c not in recommended_codes]
+        if missing_coreqs:
+            explanations.append(_restriction(course, 'missing_corequisites', {
+                'missing_courses': missing_coreqs,
+                'required_courses': course['corequisites']
+            }))
+            skipped.append(_skip(course, f"Missing corequisites: {', '.join(missing_coreqs)}"))
+            continue
+
+        credit_hours = course['credit_hours']
+        if total_credits + credit_hours > max_credits:
+            explanations.append(_restriction(course, 'credit_limit', {
+                'current_credits': total_credits,
+                'course_credits': credit_hours,
+                'max_credits': max_credits
+            }))
+            skipped.append(_skip(course, f"Would exceed credit limit ({total_credits + credit_hours} > {max_credits})"))
+            continue
+
+        # Take the first section that fits around the ones already booked
+        sections = catalog.sections[course_id]
+        section = next(((label, mask) for label, mask in sections if not mask & occupied), None)
+        if sections and section is None:
+            clashes = [code for code, mask in booked if any(mask & other for _, other in sections)]
+            explanations.append(_restriction(course, 'time_clash', {
+                'sections': [label for label, _ in sections],
+                'clashes_with': clashes
+            }))
+            skipped.append(_skip(course, f"Time clash with {', '.join(clashes)}"))
+            continue
+        if section is not None:
+            occupied |= section[1]
+            booked.append((course['code'], section[1]))
+
+        recommended.append({
+            'code': course['code'],
+            'name': course['name'],
+            'credit_hours': credit_hours
+        })
+        recommended_codes.add(course['code'])
+        total_credits += credit_hours
+        explanations.append({
+            'code': course['code'],
+            'name': course['name'],
+            'type': 'recommended',
+            'details': {
+                'prerequisites_met': [p for p in course['prerequisites'] if p in passed],
+                'corequisites_met': [c for c in course['corequisites'] if c in passed],
+                'semester_match': course['semester_offered'],
+                'track_match': course['program_track'],
+                **({'section': section[0]} if section is not None else {}),
+                **({'retake': True} if status == 'retake' else {})
+            }
+        })
+
+    return RecommendationResult(recommended, skipped, total_credits, max_credits, explanations)
+
+
+def recommend(catalog, profile, policy=None, ranker=None, interest=''):
+    """Recommend courses for one student.
+
+    With a ranker, candidates are packed most relevant first (to the passed courses and the
+    free-text interest), so the credit limit is filled with the best matches.
+
+    Reads only the shared compiled catalog, the compiled policy, the ranker and the immutable profile,
+    and keeps all per-run state in locals and the returned result, so concurrent calls are safe.
+    """
+    policy = policy or get_policy()
+    candidate_ids = policy.candidates(catalog, profile.track, profile.semester)
+    states = evaluate_candidates(catalog, candidate_ids, profile.passed, profile.failed, policy.recommend_retakes)
+    if ranker is not None:
+        candidate_ids = ranker.rank(candidate_ids, profile.passed, interest)
+    return pack_courses(catalog, packing_order(candidate_ids, states, policy), states, profile.passed,
+                        policy.credit_limit(profile.cgpa, profile.semester))
+
+
+def recommend_many(catalog, profiles, max_workers=None, policy=None, ranker=None, interest=''):
+    """Recommend courses for many students on a thread pool sharing one catalog"""
+    policy = policy or get_policy()
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(lambda profile: recommend(catalog, profile, policy, ranker, interest), profiles))
@@ -0,0 +1,244 @@
+from collections import namedtuple
+
+import numpy as np
+import pandas as pd
+
+from catalog import DEFAULT_TRACK
+from cohort_analytics import BATCH_SIZE, CohortAnalytics
+from policy import get_policy
+
+AllocationResult = namedtuple(
+    'AllocationResult',
+    ['assigned', 'credits', 'max_credits', 'capacity', 'requests']
+)
+
+# Capacity used for courses without a seat limit
+UNLIMITED = np.iinfo(np.int64).max
+
+
+def course_capacities(catalog, default_capacity=None):
+    """Seat capacity of every catalog course, falling back to the default for courses without one"""
+    default = UNLIMITED if default_capacity is None else default_capacity
+    return np.array([
+        default if course.get('capacity') is None else course['capacity']
+        for course in catalog.courses
+    ], dtype=np.int64).reshape(len(catalog))
+
+
+def offered_courses(catalog, semester, track, policy):
+    """Courses open in the term: one mask for a single track, or a students x courses matrix
+    when track holds one track per student"""
+    if isinstance(track, str):
+        offered = np.zeros(len(catalog), dtype=bool)
+        offered[list(policy.candidates(catalog, track, semester))] = True
+        return offered
+    tracks, inverse = np.unique(np.asarray(track, dtype=str), return_inverse=True)
+    offered = np.zeros((len(tracks), len(catalog)), dtype=bool)
+    for row, name in enumerate(tracks):
+        offered[row, list(policy.candidates(catalog, name, semester))] = True
+    return offered[inverse]
+
+
+def seat_requests(catalog, passed, failed, semester='Fall', track=DEFAULT_TRACK, policy=None):
+    """Boolean students x courses matrices of regular and retake requests for the term;
+    track may be one track for everyone or one per student"""
+    policy = policy or get_policy()
+    offered = offered_courses(catalog, semester, track, policy)
+    open_courses = CohortAnalytics(catalog).prerequisites_met(passed) & offered & ~passed
+    return open_courses & ~failed, open_courses & failed
+
+
+def _corequisite_ids(catalog):
+    """Catalog ids of each course's corequisites, -1 for codes outside the catalog"""
+    return [
+        tuple(catalog.code_to_id.get(code, -1) for code in course['corequisites'])
+        for course in catalog.courses
+    ]
+
+
+def _batch_requests(catalog, passed, failed, semester, track, policy, coreq_ids):
+    """Requests of one batch of students: (students, courses, retake flags, unmet corequisites).
+
+    Unmet corequisites are listed per request, so the drain no longer needs the transcripts.
+    """
+    regular, retake = seat_requests(catalog, passed, failed, semester, track, policy)
+    students, courses = np.nonzero(regular | retake)
+    missing = [
+        tuple(c for c in coreq_ids[course] if c < 0 or not passed[student, c]) if coreq_ids[course] else ()
+        for student, course in zip(students.tolist(), courses.tolist())
+    ]
+    return students, courses, retake[students, courses], missing
+
+
+def _drain(catalog, cgpa, seniority, n_students, requests, default_capacity, max_credits, policy):
+    """Grant seats for concatenated (students, courses, retake flags, unmet corequisites) requests"""
+    students, courses, is_retake, missing = requests
+    credit_hours = np.array([course['credit_hours'] for course in catalog.courses], dtype=np.int64)
+    capacity = course_capacities(catalog, default_capacity)
+    is_retake = is_retake & policy.retake_priority
+
+    # lexsort sorts by the last key first, so list keys from least to most significant
+    order = np.lexsort((
+        courses,
+        students,
+        -np.asarray(seniority)[students],
+        -np.asarray(cgpa, dtype=float)[students],
+        ~is_retake
+    ))
+
+    assigned = np.zeros((n_students, len(catalog)), dtype=bool)
+    seats_left = capacity.tolist()
+    hours = credit_hours.tolist()
+    caps = max_credits.tolist()
+    credits = [0] * n_students
+    # Timeslots taken by each student's granted sections, as in pack_courses
+    occupied = [0] * n_students
+
+    for index in order.tolist():
+        student, course_id = int(students[index]), int(courses[index])
+        if not seats_left[course_id] or credits[student] + hours[course_id] > caps[student]:
+            continue
+        # Corequisites not passed must have been granted earlier in the drain
+        if missing[index] and not all(c >= 0 and assigned[student, c] for c in missing[index]):
+            continue
+        # Take the first section that fits around the student's granted sections
+        sections = catalog.sections[course_id]
+        if sections:
+            mask = next((mask for _, mask in sections if not mask & occupied[student]), None)
+            if mask is None:
+                continue
+            occupied[student] |= mask
+        assigned[student, course_id] = True
+        seats_left[course_id] -= 1
+        credits[student] += hours[course_id]
+
+    counts = np.bincount(courses, minlength=len(catalog))
+    return AllocationResult(assigned, np.array(credits, dtype=np.int64), max_credits, capacity, counts)
+
+
+def allocate_seats(catalog, cgpa, passed, failed, semester='Fall', track=DEFAULT_TRACK,
+                   seniority=None, default_capacity=None, policy=None):
+    """Assign seats to a whole registration cohort in priority order.
+
+    track is one track for the whole cohort or an array with one track per student. Every (student, course) request gets a priority key: retakes of failed courses first
+    (when the policy gives retakes priority), then higher CGPA, then seniority (credit hours passed unless given), then the student's
+    own catalog order. Requests are drained from that order once, granting a seat while the
+    course has capacity, the student stays under their credit cap, the course's
+    corequisites are passed or already granted and one of its sections fits around the
+    student's granted sections.
+    """
+    policy = policy or get_policy()
+    if seniority is None:
+        credit_hours = np.array([course['credit_hours'] for course in catalog.courses], dtype=np.int64)
+        seniority = passed.astype(np.int64) @ credit_hours
+    requests = _batch_requests(catalog, passed, failed, semester, track, policy, _corequisite_ids(catalog))
+    return _drain(catalog, cgpa, seniority, len(passed), requests, default_capacity,
+                  policy.credit_limits(cgpa, semester), policy)
+
+
+def allocate_store(catalog, store, semester='Fall', track=DEFAULT_TRACK, default_capacity=None,
+                   policy=None, batch_size=BATCH_SIZE):
+    """Assign seats to a cohort streamed from a transcript store, batch by batch.
+
+    Only the requests are collected; transcripts are never unpacked for the whole cohort at once.
+    Seniority is the credit hours passed, and track may hold one track per student.
+    """
+    if store.course_codes != [course['code'] for course in catalog.courses]:
+        raise ValueError("Transcript store does not match this catalog's course ids")
+    policy = policy or get_policy()
+    credit_hours = np.array([course['credit_hours'] for course in catalog.courses], dtype=np.int64)
+    coreq_ids = _corequisite_ids(catalog)
+
+    seniority = np.zeros(len(store), dtype=np.int64)
+    students, courses, retakes, missing = [], [], [], []
+    offset = 0
+    for passed, failed in store.batches(batch_size):
+        seniority[offset:offset + len(passed)] = passed.astype(np.int64) @ credit_hours
+        batch_track = track if isinstance(track, str) else track[offset:offset + len(passed)]
+        batch_students, batch_courses, batch_retakes, batch_missing = _batch_requests(
+            catalog, passed, failed, semester, batch_track, policy, coreq_ids
+        )
+        students.append(batch_students + offset)
+        courses.append(batch_courses)
+        retakes.append(batch_retakes)
+        missing.extend(batch_missing)
+        offset += len(passed)
+
+    requests = (
+        np.concatenate(students or [np.empty(0, dtype=np.int64)]),
+        np.concatenate(courses or [np.empty(0, dtype=np.int64)]),
+        np.concatenate(retakes or [np.empty(0, dtype=bool)]),
+        missing
+    )
+    cgpa = np.asarray(store.cgpa, dtype=float)
+    return _drain(catalog, cgpa, seniority, len(store), requests, default_capacity,
+                  policy.credit_limits(cgpa, semester), policy)
+
+
+def allocation_table(catalog, result):
+    """Per-course seat demand and fill statistics of an allocation"""
+    allocated = result.assigned.sum(axis=0)
+    # Unlimited courses have no meaningful capacity or fill rate
+    capacity = np.where(result.capacity != UNLIMITED, result.capacity, np.nan)
+    return pd.DataFrame({
+        'Course Code': [c['code'] for c in catalog.courses],
+        'Course Name': [c['name'] for c in catalog.courses],
+        'Capacity': capacity,
+        'Requests': result.requests,
+        'Allocated': allocated,
+        'Not Allocated': result.requests - allocated,
+        'Fill Rate': np.divide(allocated, capacity, out=np.full(len(capacity), np.nan), where=capacity > 0)
+    })
+
+
+def student_allocations(catalog, student_ids, result):
+    """Per-student seat assignments of an allocation"""
+    codes = np.array([course['code'] for course in catalog.courses], dtype=object)
+    return pd.DataFrame({
+        'Student ID': student_ids,
+        'Assigned Courses': [', '.join(codes[row]) for row in result.assigned],
+        'Credits': result.credits,
+        'Credit Limit': result.max_credits
+    })
+
+
+def main():
+    """Simulate registration for a cohort CSV and write the allocation tables next to it.
+
+    Usage: seat_allocation.py <cohort.csv> [semester] [program] [year]. A Track column in the
+    cohort file gives each student's track; DEFAULT_CAPACITY caps courses without a capacity.
+    """
+    import os
+    import sys
+    from catalog_registry import CatalogRegistry, DEFAULT_PROGRAM
+    from cohort_analytics import load_cohort_csv
+
+    if len(sys.argv) < 2:
+        print(main.__doc__)
+        return
+    filename = sys.argv[1]
+    semester = sys.argv[2] if len(sys.argv) > 2 else 'Fall'
+    program = sys.argv[3] if len(sys.argv) > 3 else DEFAULT_PROGRAM
+    year = sys.argv[4] if len(sys.argv) > 4 else None
+    default_capacity = os.getenv('DEFAULT_CAPACITY')
+    try:
+        catalog = CatalogRegistry().get(program, year)
+        student_ids, cgpa, passed, failed = load_cohort_csv(catalog, filename)
+    except (KeyError, OSError, ValueError) as e:
+        print(f"Failed to load cohort: {e}")
+        return
+
+    tracks = pd.read_csv(filename, dtype=str).rename(columns=str.strip).get('Track')
+    track = DEFAULT_TRACK if tracks is None else tracks.fillna(DEFAULT_TRACK).str.strip().to_numpy()
+    result = allocate_seats(catalog, cgpa, passed, failed, semester, track,
+                            default_capacity=None if default_capacity is None else int(default_capacity))
+
+    prefix = os.path.splitext(filename)[0]
+    allocation_table(catalog, result).to_csv(f"{prefix}_allocation_courses.csv", index=False)
+    student_allocations(catalog, student_ids, result).to_csv(f"{prefix}_allocation_students.csv", index=False)
+    print(f"{int(result.assigned.sum())} of {int(result.requests.sum())} seat requests granted "
+          f"for {len(student_ids)} students -> {prefix}_allocation_*.csv")
+
+
+if __name__ == "__main__":
+    main()
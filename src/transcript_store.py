@@ -0,0 +1,143 @@
+import json
+import os
+
+import numpy as np
+import pandas as pd
+
+from cohort_analytics import codes_to_matrix, BATCH_SIZE
+
+STORE_FORMAT = 1
+META_FILE = 'meta.json'
+
+
+class TranscriptStoreWriter:
+    """Writes fixed-width transcript rows into a new store directory.
+
+    Student ids are stored in a fixed-width column of id_width characters; longer ids are rejected.
+    Terms are stored as int16, with 0 meaning unknown; negative or larger terms are rejected.
+    """
+
+    def __init__(self, path, catalog, n_students, id_width=16):
+        os.makedirs(path, exist_ok=True)
+        self.path = path
+        self.catalog = catalog
+        self.n_students = n_students
+        self.position = 0
+        self.id_width = id_width
+        row_bytes = (len(catalog) + 7) // 8
+
+        open_memmap = np.lib.format.open_memmap
+        self.student_ids = open_memmap(os.path.join(path, 'student_ids.npy'), 'w+', f'U{id_width}', (n_students,))
+        self.passed = open_memmap(os.path.join(path, 'passed.npy'), 'w+', np.uint8, (n_students, row_bytes))
+        self.failed = open_memmap(os.path.join(path, 'failed.npy'), 'w+', np.uint8, (n_students, row_bytes))
+        self.cgpa = open_memmap(os.path.join(path, 'cgpa.npy'), 'w+', np.float32, (n_students,))
+        self.term = open_memmap(os.path.join(path, 'term.npy'), 'w+', np.int16, (n_students,))
+
+    def append(self, student_ids, cgpa, passed, failed, term=None):
+        """Append a batch of students given as arrays and students x courses boolean matrices"""
+        start, end = self.position, self.position + len(student_ids)
+        if end > self.n_students:
+            raise ValueError(f"Store was sized for {self.n_students} students")
+        student_ids = np.asarray(student_ids, dtype=str)
+        if len(student_ids) and np.char.str_len(student_ids).max() > self.id_width:
+            raise ValueError(f"Student ids longer than {self.id_width} characters do not fit the store")
+        if term is not None:
+            term = np.asarray(term, dtype=float)
+            if np.isnan(term).any() or (term % 1 != 0).any():
+                raise ValueError("Terms must be whole numbers")
+            if ((term < 0) | (term > np.iinfo(self.term.dtype).max)).any():
+                raise ValueError(f"Terms must be between 0 and {np.iinfo(self.term.dtype).max}")
+        self.student_ids[start:end] = student_ids
+        self.cgpa[start:end] = cgpa
+        self.term[start:end] = 0 if term is None else term
+        self.passed[start:end] = np.packbits(passed, axis=1)
+        self.failed[start:end] = np.packbits(failed, axis=1)
+        self.position = end
+
+    def close(self):
+        """Flush the columns and write the metadata that makes the store readable"""
+        for column in (self.student_ids, self.passed, self.failed, self.cgpa, self.term):
+            column.flush()
+        meta = {
+            'format': STORE_FORMAT,
+            'catalog_version': self.catalog.version,
+            'course_codes': [course['code'] for course in self.catalog.courses],
+            'students': self.position
+        }
+        with open(os.path.join(self.path, META_FILE), 'w', encoding='utf-8') as file:
+            json.dump(meta, file)
+
+
+class TranscriptStore:
+    """Read-only, memory-mapped view of a transcript store"""
+
+    def __init__(self, path, catalog=None):
+        with open(os.path.join(path, META_FILE), 'r', encoding='utf-8') as file:
+            self.meta = json.load(file)
+        if self.meta['format'] != STORE_FORMAT:
+            raise ValueError(f"Unsupported transcript store format: {self.meta['format']}")
+        if catalog is not None and catalog.version != self.meta['catalog_version']:
+            raise ValueError("Transcript store was built for a different catalog version")
+
+        self.path = path
+        self.course_codes = self.meta['course_codes']
+        self.student_ids = self._column('student_ids')
+        self.passed = self._column('passed')
+        self.failed = self._column('failed')
+        self.cgpa = self._column('cgpa')
+        self.term = self._column('term')
+
+    def _column(self, name):
+        """Memory-map one column file, trimmed to the rows actually written"""
+        return np.load(os.path.join(self.path, f'{name}.npy'), mmap_mode='r')[:self.meta['students']]
+
+    def __len__(self):
+        return len(self.student_ids)
+
+    def _unpack(self, bits):
+        """Expand packed status bitmaps into a boolean students x courses matrix"""
+        return np.unpackbits(bits, axis=1, count=len(self.course_codes)).astype(bool)
+
+    def batches(self, batch_size=BATCH_SIZE):
+        """Stream (passed, failed) boolean matrices batch by batch straight from disk"""
+        for start in range(0, len(self), batch_size):
+            end = start + batch_size
+            yield self._unpack(self.passed[start:end]), self._unpack(self.failed[start:end])
+
+    def student(self, index):
+        """Return one student's transcript with course codes, for display"""
+        passed = self._unpack(self.passed[index:index + 1])[0]
+        failed = self._unpack(self.failed[index:index + 1])[0]
+        return {
+            'student_id': str(self.student_ids[index]),
+            'cgpa': float(self.cgpa[index]),
+            'term': int(self.term[index]),
+            'passed_courses': [self.course_codes[i] for i in np.flatnonzero(passed)],
+            'failed_courses': [self.course_codes[i] for i in np.flatnonzero(failed)]
+        }
+
+
+def convert_cohort_csv(catalog, filename, path, chunksize=BATCH_SIZE):
+    """Convert a cohort transcript CSV into a transcript store without loading it all at once"""
+    # A first pass counts the students and sizes the id column to the longest id
+    n_students = 0
+    id_width = 1
+    for chunk in pd.read_csv(filename, usecols=lambda col: col.strip() == 'Student ID', dtype=str,
+                             keep_default_na=False, chunksize=chunksize):
+        n_students += len(chunk)
+        if len(chunk):
+            id_width = max(id_width, int(chunk.iloc[:, 0].str.len().max()))
+    writer = TranscriptStoreWriter(path, catalog, n_students, id_width)
+    # Both passes read every column as text so ids are parsed the same way the first pass measured them
+    for chunk in pd.read_csv(filename, dtype=str, keep_default_na=False, chunksize=chunksize):
+        chunk.columns = [col.strip() for col in chunk.columns]
+        writer.append(
+            chunk['Student ID'].to_numpy(),
+            pd.to_numeric(chunk['CGPA']).to_numpy(dtype=float),
+            codes_to_matrix(catalog, chunk['Passed Courses']),
+            codes_to_matrix(catalog, chunk['Failed Courses']),
+            # Blank terms are stored as 0, the same as in a store written without terms
+            pd.to_numeric(chunk['Term'].str.strip().replace('', '0')).to_numpy() if 'Term' in chunk.columns else None
+        )
+    writer.close()
+    return TranscriptStore(path, catalog)
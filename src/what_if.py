@@ -0,0 +1,115 @@
+from collections import ChainMap
+
+from catalog import DEFAULT_TRACK
+from policy import get_policy
+from recommender import evaluate_course, evaluate_candidates, pack_courses, packing_order, restriction
+
+
+class WhatIfSession:
+    """Keeps a student's last recommendation and updates it incrementally as the transcript changes"""
+
+    def __init__(self, catalog, cgpa, semester, track=DEFAULT_TRACK, passed=(), failed=(), ranker=None,
+                 interest='', policy=None):
+        self.catalog = catalog
+        self.policy = policy or get_policy()
+        self.ranker = ranker
+        self.interest = interest
+        self.semester = semester
+        self.track = track
+        self.max_credits = self.policy.credit_limit(cgpa, semester)
+        self.candidate_ids = self.policy.candidates(catalog, track, semester)
+        self._candidate_set = frozenset(self.candidate_ids)
+
+        self.passed = frozenset(passed)
+        self.failed = frozenset(failed)
+        self.states = evaluate_candidates(catalog, self.candidate_ids, self.passed, self.failed,
+                                          self.policy.recommend_retakes)
+        # Explanation and skipped entries of candidates ruled out by their state alone; None if packable.
+        # They are rebuilt only when a state changes, so results share these entries.
+        self.restrictions = self._restrictions(self.states)
+        self.last_evaluated = len(self.candidate_ids)
+        self.result = self._pack(self.states, self.restrictions, self.passed)
+
+    def _order(self, passed):
+        """Return the candidates in packing order, most relevant first when a ranker is set"""
+        if self.ranker is None:
+            return self.candidate_ids
+        return self.ranker.rank(self.candidate_ids, passed, self.interest)
+
+    def _restrictions(self, states):
+        """Return the cached explanation entries for the given candidate states"""
+        return {course_id: restriction(self.catalog.courses[course_id], state) for course_id, state in states.items()}
+
+    def _pack(self, states, restrictions, passed):
+        """Pack only the packable candidates, then merge in the cached entries of the others in order"""
+        order = packing_order(self._order(passed), states, self.policy)
+        packed = pack_courses(self.catalog, [course_id for course_id in order if restrictions[course_id] is None],
+                              states, passed, self.max_credits)
+
+        # Packing yields one explanation per course and a skipped entry for each one not recommended
+        packed_explanations = iter(packed.explanations)
+        packed_skipped = iter(packed.skipped)
+        explanations = []
+        skipped = []
+        for course_id in order:
+            entry = restrictions[course_id]
+            if entry is None:
+                explanation = next(packed_explanations)
+                skip = None if explanation['type'] == 'recommended' else next(packed_skipped)
+            else:
+                explanation, skip = entry
+            explanations.append(explanation)
+            if skip is not None:
+                skipped.append(skip)
+        return packed._replace(skipped=skipped, explanations=explanations)
+
+    def _affected_ids(self, changed_codes):
+        """Return the candidate ids whose eligibility state may change with the given courses"""
+        affected = set()
+        for code in changed_codes:
+            course_id = self.catalog.code_to_id.get(code)
+            if course_id is not None:
+                affected.add(course_id)
+            affected |= self.catalog.dependent_ids(code)
+        return affected & self._candidate_set
+
+    def _reevaluate(self, passed, failed):
+        """Return fresh states for only the candidates touched by a transcript change"""
+        changed = (passed ^ self.passed) | (failed ^ self.failed)
+        return {
+            course_id: evaluate_course(self.catalog.courses[course_id], passed, failed, self.policy.recommend_retakes)
+            for course_id in self._affected_ids(changed)
+        }
+
+    def update(self, passed=None, failed=None, cgpa=None, interest=None):
+        """Apply a transcript, CGPA or interest edit and return the refreshed recommendation"""
+        passed = self.passed if passed is None else frozenset(passed)
+        failed = self.failed if failed is None else frozenset(failed)
+        if cgpa is not None:
+            self.max_credits = self.policy.credit_limit(cgpa, self.semester)
+        if interest is not None:
+            self.interest = interest
+
+        changes = self._reevaluate(passed, failed)
+        self.states.update(changes)
+        self.restrictions.update(self._restrictions(changes))
+        self.passed, self.failed = passed, failed
+        self.last_evaluated = len(changes)
+        self.result = self._pack(self.states, self.restrictions, passed)
+        return self.result
+
+    def what_if(self, pass_courses=(), fail_courses=()):
+        """Return the recommendation for a hypothetical outcome without changing the session"""
+        passed = (self.passed | frozenset(pass_courses)) - frozenset(fail_courses)
+        failed = (self.failed | frozenset(fail_courses)) - frozenset(pass_courses)
+        changes = self._reevaluate(passed, failed)
+        states = ChainMap(changes, self.states)
+        restrictions = ChainMap(self._restrictions(changes), self.restrictions)
+        return self._pack(states, restrictions, passed)
+
+    def compare(self, scenarios):
+        """Evaluate several named what-if scenarios side by side"""
+        return {
+            name: self.what_if(scenario.get('pass', ()), scenario.get('fail', ()))
+            for name, scenario in scenarios.items()
+        }
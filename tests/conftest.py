@@ -0,0 +1,73 @@
+import os
+import random
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, 'src'))
+
+from catalog import DEFAULT_TRACK, CompiledCatalog  # noqa: E402
+from catalog_loader import load_catalog_file  # noqa: E402
+from policy import DEFAULT_RULES, Policy  # noqa: E402
+from recommender import make_profile  # noqa: E402
+
+CATALOG_FILE = os.path.join(ROOT, 'data', 'CE_Cloud.csv')
+
+
+def make_course(code, credit_hours=3, prerequisites=(), corequisites=(), semester='Fall',
+                track='All', capacity=None, meeting_times=''):
+    """Build a catalog course with the fields the loader produces"""
+    return {
+        'code': code,
+        'name': f"Course {code}",
+        'description': '',
+        'prerequisites': list(prerequisites),
+        'corequisites': list(corequisites),
+        'credit_hours': credit_hours,
+        'semester_offered': semester,
+        'program_track': track,
+        'capacity': capacity,
+        'meeting_times': meeting_times
+    }
+
+
+def random_profiles(catalog, count, seed=0):
+    """Random transcripts over the catalog's codes and tracks"""
+    rng = random.Random(seed)
+    codes = [course['code'] for course in catalog.courses]
+    for _ in range(count):
+        passed = set(rng.sample(codes, rng.randint(0, len(codes) // 2)))
+        failed = set(rng.sample(codes, rng.randint(0, 4))) - passed
+        yield make_profile(rng.choice([1.5, 2.0, 2.5, 3.0, 3.5, 4.0]), rng.choice(['Fall', 'Spring', 'Summer']),
+                           passed, failed, rng.choice(catalog.tracks or [DEFAULT_TRACK]))
+
+
+@pytest.fixture(scope='session')
+def catalog():
+    """The shipped catalog"""
+    return load_catalog_file(CATALOG_FILE)[0]
+
+
+@pytest.fixture
+def policy():
+    """The built-in advising rules"""
+    return Policy(DEFAULT_RULES)
+
+
+@pytest.fixture
+def retake_policy():
+    """Built-in rules with retakes recommended and prioritized"""
+    return Policy(dict(DEFAULT_RULES, retakes={'recommend': True, 'priority': True}))
+
+
+@pytest.fixture
+def small_catalog():
+    """A five-course catalog with a prerequisite chain and a corequisite pair"""
+    return CompiledCatalog([
+        make_course('A100'),
+        make_course('A200', prerequisites=['A100']),
+        make_course('B101', credit_hours=1),
+        make_course('B100', corequisites=['B101']),
+        make_course('C100', credit_hours=4, semester='Spring'),
+    ])
@@ -0,0 +1,73 @@
+import os
+import threading
+
+from answer_table import (AnswerTable, answer_table_path, build_answer_table, load_answer_table,
+                          prune_answer_tables, save_answer_table)
+from conftest import random_profiles
+from policy import Policy
+from recommender import make_profile, recommend
+
+
+def test_table_answers_match_live_evaluation(small_catalog, policy):
+    table = build_answer_table(small_catalog, policy)
+    assert table.stats()['states'] > 0
+    for profile in random_profiles(small_catalog, 200):
+        result = table.lookup(small_catalog, profile)
+        if result is not None:
+            assert result == recommend(small_catalog, profile, policy)
+        assert table.recommend(small_catalog, profile) == recommend(small_catalog, profile, policy)
+
+
+def test_standard_plan_states_are_hits(small_catalog, policy):
+    table = build_answer_table(small_catalog, policy)
+    assert table.lookup(small_catalog, make_profile(3.5, 'Fall', set())) is not None
+    # An unknown course code can never be in the table
+    assert table.lookup(small_catalog, make_profile(3.5, 'Fall', {'ZZZ999'})) is None
+    assert (table.stats()['hits'], table.stats()['misses']) == (1, 1)
+
+
+def test_lookup_returns_a_copy(small_catalog, policy):
+    table = build_answer_table(small_catalog, policy)
+    profile = make_profile(3.5, 'Fall', set())
+    result = table.lookup(small_catalog, profile)
+    result.recommended.clear()
+    result.explanations[0]['code'] = 'CHANGED'
+    assert table.lookup(small_catalog, profile) == recommend(small_catalog, profile, policy)
+
+
+def test_concurrent_lookups_are_all_counted(small_catalog, policy):
+    table = build_answer_table(small_catalog, policy)
+    profile = make_profile(3.5, 'Fall', set())
+
+    def lookups():
+        for _ in range(500):
+            table.lookup(small_catalog, profile)
+
+    threads = [threading.Thread(target=lookups) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert table.stats()['hits'] == 2000
+
+
+def test_saved_table_only_loads_for_its_version(small_catalog, policy, tmp_path):
+    table = build_answer_table(small_catalog, policy)
+    filename = save_answer_table(table, str(tmp_path))
+    assert filename == answer_table_path(table.version, str(tmp_path))
+    loaded = load_answer_table(filename, small_catalog, policy)
+    assert loaded.answers == table.answers and loaded.stats()['states'] == table.stats()['states']
+
+    other_policy = Policy(dict(policy.rules, max_failed_attempts=policy.rules.get('max_failed_attempts', 0) + 1))
+    assert load_answer_table(filename, small_catalog, other_policy) is None
+    assert load_answer_table(str(tmp_path / 'missing.pkl'), small_catalog, policy) is None
+
+
+def test_pruning_keeps_the_most_recently_used_tables(tmp_path):
+    for i in range(5):
+        table = AnswerTable(f"v{i}", None)
+        save_answer_table(table, str(tmp_path), keep=10)
+        os.utime(answer_table_path(table.version, str(tmp_path)), (i, i))
+    deleted = prune_answer_tables(str(tmp_path), keep=2)
+    assert sorted(os.path.basename(name) for name in deleted) == ['answers_v0.pkl', 'answers_v1.pkl', 'answers_v2.pkl']
+    assert sorted(os.listdir(tmp_path)) == ['answers_v3.pkl', 'answers_v4.pkl']
@@ -0,0 +1,27 @@
+from catalog import DEFAULT_TRACK, CompiledCatalog, parse_tracks
+from conftest import make_course
+
+
+def test_blank_track_courses_belong_to_the_default_track():
+    catalog = CompiledCatalog([make_course('A100', track=''), make_course('B100', track='AI Engineering')])
+    assert catalog.candidates(DEFAULT_TRACK, 'Fall') == (0,)
+    assert catalog.candidates('AI Engineering', 'Fall') == (1,)
+    other = CompiledCatalog(catalog.courses, default_track='AI Engineering')
+    assert other.candidates('AI Engineering', 'Fall') == (0, 1)
+    assert other.version != catalog.version
+
+
+def test_shipped_blank_track_courses_are_recommendable(catalog):
+    assert catalog.code_to_id['CSE363'] in catalog.track_course_ids(DEFAULT_TRACK)
+
+
+def test_listed_tracks_and_universal_courses():
+    catalog = CompiledCatalog([
+        make_course('A100', track='Computer Engineering, AI Engineering (Elective)'),
+        make_course('B100', track='All (Mandatory)'),
+        make_course('C100', track='Robotics'),
+    ])
+    assert catalog.tracks == ['AI Engineering', 'Computer Engineering', 'Robotics']
+    assert sorted(catalog.track_course_ids('ai engineering')) == [0, 1]
+    assert sorted(catalog.track_course_ids('Robotics')) == [1, 2]
+    assert parse_tracks(' AI  Engineering (Elective), ') == frozenset({'ai engineering'})
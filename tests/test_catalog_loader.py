@@ -0,0 +1,87 @@
+import pytest
+
+from catalog import parse_capacity, parse_credit_hours
+from catalog_loader import catalog_frame, load_catalog_file
+from kb_validator import has_errors, validate_catalog
+
+HEADER = 'Course Code,Course Name,Description,Prerequisites,Co-requisites,Credit Hours,Semester Offered,Program/Track\n'
+
+
+def write(path, text):
+    path.write_text(text, encoding='utf-8')
+    return str(path)
+
+
+def test_rows_are_streamed_deduplicated_and_reported(tmp_path):
+    filename = write(tmp_path / 'catalog.csv', HEADER + (
+        'A100,Intro,,,,3,Fall,All\n'
+        'A100,Intro again,,,,3,Fall,All\n'
+        'B100,Short row,,A100\n'
+        'C100,Long row,,,,3,Fall,All,extra\n'
+        ',No code,,,,3,Fall,All\n'
+        'D100,Bad credits,,,,3.5,Fall,All\n'
+        'E100,Blank credits,,A100,,,Spring,\n'
+    ))
+    catalog, (report,) = load_catalog_file(filename, chunksize=2)
+    assert [course['code'] for course in catalog.courses] == ['A100', 'E100']
+    assert catalog.courses[0]['name'] == 'Intro' and catalog.courses[1]['credit_hours'] == 0
+    assert (report.rows, report.loaded, report.duplicates) == (7, 2, 1)
+    assert [(error['line'], error['code']) for error in report.errors] == [
+        (3, 'A100'), (4, 'B100'), (5, 'C100'), (6, ''), (7, 'D100')
+    ]
+
+
+def test_missing_columns_are_rejected(tmp_path):
+    filename = write(tmp_path / 'catalog.csv', 'Course Code,Course Name\nA100,Intro\n')
+    with pytest.raises(ValueError):
+        load_catalog_file(filename)
+
+
+def test_offering_sections_are_merged_into_courses(tmp_path):
+    filename = write(tmp_path / 'catalog.csv', HEADER + 'A100,Intro,,,,3,Fall,All\nB100,Other,,,,3,Fall,All\n')
+    offerings_file = write(tmp_path / 'catalog.offerings.csv', (
+        'Course Code,Section,Semester Offered,Capacity,Meeting Times\n'
+        'A100,01,Spring,30,Mon 09:00-10:00\n'
+        'A100,02,,20,Tue 09:00-10:00\n'
+        'Z999,01,Fall,10,Mon 09:00-10:00\n'
+        'B100,01,,lots,\n'
+        'Z999,02,Fall,10,\n'
+    ))
+    catalog, (report, offering_report) = load_catalog_file(filename, offerings_file)
+    a100 = catalog.course('A100')
+    assert a100['semester_offered'] == 'Spring' and a100['capacity'] == 50
+    assert a100['meeting_times'] == '01: Mon 09:00-10:00 | 02: Tue 09:00-10:00'
+    assert [label for label, _ in catalog.sections[0]] == ['01', '02']
+    assert catalog.course('B100')['capacity'] is None
+    # Rows for a course outside the catalog are not loaded
+    assert (offering_report.rows, offering_report.loaded) == (5, 2)
+    assert [(error['line'], error['code']) for error in offering_report.errors] == [
+        (4, 'Z999'), (5, 'B100'), (6, 'Z999')
+    ]
+    assert report.loaded == 2 and not report.errors
+
+
+def test_catalog_frame_matches_the_file(catalog):
+    df = catalog_frame(catalog)
+    assert len(df) == len(catalog)
+    assert df['Course Code'].tolist() == [course['code'] for course in catalog.courses]
+    assert not has_errors(validate_catalog(df))
+
+
+@pytest.mark.parametrize('value, expected', [
+    ('30', 30), ('30.0', 30), (' 12 ', 12), ('', None), ('abc', None), ('-1', None),
+    ('inf', None), ('1e400', None), ('nan', None),
+])
+def test_parse_capacity(value, expected):
+    assert parse_capacity(value) == expected
+
+
+@pytest.mark.parametrize('value, expected', [('3', 3), ('3.0', 3), (' 4 ', 4), ('', 0), (None, 0)])
+def test_parse_credit_hours(value, expected):
+    assert parse_credit_hours(value) == expected
+
+
+@pytest.mark.parametrize('value', ['3.5', 'three', 'inf'])
+def test_parse_credit_hours_rejects_fractions_and_text(value):
+    with pytest.raises(ValueError):
+        parse_credit_hours(value)
@@ -0,0 +1,111 @@
+import threading
+
+import pytest
+
+from catalog import CompiledCatalog
+from catalog_registry import CatalogRegistry, estimate_size
+from conftest import make_course
+
+
+def fake_catalog(filename):
+    """One-course catalog named after its file"""
+    return CompiledCatalog([make_course(filename.upper())])
+
+
+def make_registry(loader, programs=('a', 'b', 'c'), budget_catalogs=2):
+    budget = int(estimate_size(fake_catalog('a')) * (budget_catalogs + 0.5))
+    registry = CatalogRegistry(catalog_dir=None, memory_budget=budget, loader=loader)
+    for program in programs:
+        registry.register(program, None, program)
+    return registry
+
+
+def counting_loader(calls):
+    def loader(filename):
+        calls.append(filename)
+        return fake_catalog(filename), []
+    return loader
+
+
+def test_estimate_size_counts_indexes():
+    catalog = fake_catalog('a')
+    bigger = CompiledCatalog([make_course('A', meeting_times='Mon 09:00-10:00 | Tue 09:00-10:00')])
+    assert estimate_size(bigger) > estimate_size(catalog) > 0
+
+
+def test_least_recently_used_catalog_is_evicted():
+    calls = []
+    registry = make_registry(counting_loader(calls))
+    a = registry.get('a')
+    registry.get('b')
+    assert registry.get('a') is a
+    registry.get('c')
+    assert registry.stats()['resident'] == ['a', 'c']
+    assert registry.stats()['evictions'] == 1
+    registry.get('b')
+    assert calls == ['a', 'b', 'c', 'b']
+
+
+def test_concurrent_requests_share_one_load():
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    def slow_loader(filename):
+        calls.append(filename)
+        if filename == 'a':
+            started.set()
+            release.wait()
+        return fake_catalog(filename), []
+
+    registry = make_registry(slow_loader)
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(registry.get('a'))) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    started.wait()
+    # The load runs outside the registry lock, so other catalogs are not blocked by it
+    assert registry.get('b').courses[0]['code'] == 'B'
+    release.set()
+    for thread in threads:
+        thread.join()
+    assert calls == ['a', 'b'] and len(results) == 4 and all(r is results[0] for r in results)
+
+
+def test_failed_load_is_retried():
+    attempts = []
+
+    def flaky_loader(filename):
+        attempts.append(filename)
+        if len(attempts) == 1:
+            raise OSError('disk hiccup')
+        return fake_catalog(filename), []
+
+    registry = make_registry(flaky_loader)
+    with pytest.raises(OSError):
+        registry.get('a')
+    assert registry.get('a').courses[0]['code'] == 'A'
+    assert attempts == ['a', 'a']
+
+
+def test_derived_objects_are_released_with_their_catalog():
+    registry = make_registry(counting_loader([]))
+    built = []
+
+    def factory(catalog):
+        built.append(catalog)
+        return object()
+
+    pool = registry.derived('a', None, 'pool', factory)
+    assert registry.derived('a', None, 'pool', factory) is pool
+    assert registry.derived('a', None, 'pool', factory, version=2) is not pool
+    assert len(built) == 2 and registry.stats()['derived'] == 1
+
+    registry.get('b')
+    registry.get('c')
+    assert registry.stats()['derived'] == 0
+    registry.derived('a', None, 'pool', factory, version=2)
+    assert len(built) == 3 and built[2] is not built[0]
+
+    registry.evict('a')
+    assert registry.stats()['derived'] == 0 and 'a' not in registry.stats()['resident']
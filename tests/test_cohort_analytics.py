@@ -0,0 +1,90 @@
+import numpy as np
+import pandas as pd
+
+from catalog import CompiledCatalog
+from cohort_analytics import CohortAnalytics, bottlenecks, codes_to_matrix, failure_cascades
+from conftest import make_course
+
+
+def chain_catalog():
+    """A100 -> A200 -> A300, B100 needs A100 and A200, C100 needs an approval"""
+    return CompiledCatalog([
+        make_course('A100'),
+        make_course('A200', prerequisites=['A100']),
+        make_course('A300', prerequisites=['A200']),
+        make_course('B100', prerequisites=['A100', 'A200'], semester='Spring'),
+        make_course('C100', prerequisites=['Department Approval']),
+    ])
+
+
+def naive_table(catalog, passed, failed, semester):
+    """Per-student loops over the same definitions the vectorized table uses"""
+    ids = catalog.code_to_id
+    rows = []
+    for course_id, course in enumerate(catalog.courses):
+        blocked = blocking = eligible = delayed = 0
+        for student in range(len(passed)):
+            unmet = [p for p in course['prerequisites'] if p not in ids or not passed[student, ids[p]]]
+            is_blocked = bool(unmet) and not passed[student, course_id]
+            blocked += is_blocked
+            eligible += (not passed[student, course_id] and not failed[student, course_id] and not unmet
+                         and catalog.is_semester_eligible(course_id, semester))
+        for dependent_id, dependent in enumerate(catalog.courses):
+            if course['code'] in dependent['prerequisites']:
+                blocking += sum(not passed[s, course_id] and not passed[s, dependent_id] for s in range(len(passed)))
+        downstream = CohortAnalytics(catalog).downstream[course_id]
+        for student in np.flatnonzero(failed[:, course_id]):
+            delayed += int((~passed[student, downstream]).sum())
+        rows.append((blocked, blocking, eligible, delayed))
+    return rows
+
+
+def test_downstream_is_transitive():
+    analytics = CohortAnalytics(chain_catalog())
+    assert [d.tolist() for d in analytics.downstream] == [[1, 2, 3], [2, 3], [], [], []]
+
+
+def test_course_table_matches_per_student_loops(policy):
+    catalog = chain_catalog()
+    rng = np.random.default_rng(0)
+    passed = rng.random((40, len(catalog))) < 0.4
+    failed = (rng.random((40, len(catalog))) < 0.2) & ~passed
+    table = CohortAnalytics(catalog).analyze(passed, failed, 'Fall', policy=policy)
+    got = list(zip(table['Blocked Students'], table['Blocking Count'], table['Eligible Next Term'],
+                   table['Delayed Enrolments']))
+    assert got == naive_table(catalog, passed, failed, 'Fall')
+    assert table['Passed'].tolist() == passed.sum(axis=0).tolist()
+    # C100's approval can never be met from a transcript
+    assert table.loc[4, 'Eligible Next Term'] == 0
+
+
+def test_batched_and_whole_cohort_tables_agree(policy):
+    catalog = chain_catalog()
+    rng = np.random.default_rng(1)
+    passed = rng.random((25, len(catalog))) < 0.5
+    failed = (rng.random((25, len(catalog))) < 0.2) & ~passed
+    analytics = CohortAnalytics(catalog)
+    whole = analytics.analyze(passed, failed, policy=policy)
+    batches = [(passed[i:i + 7], failed[i:i + 7]) for i in range(0, 25, 7)]
+    pd.testing.assert_frame_equal(analytics.course_table(batches, policy=policy), whole)
+
+
+def test_codes_to_matrix_ignores_unknown_codes():
+    catalog = chain_catalog()
+    matrix = codes_to_matrix(catalog, pd.Series(['A100, A300', None, 'ZZZ999,B100', '']))
+    assert matrix.tolist() == [
+        [True, False, True, False, False],
+        [False] * 5,
+        [False, False, False, True, False],
+        [False] * 5,
+    ]
+
+
+def test_summaries_sort_by_impact(policy):
+    catalog = chain_catalog()
+    passed = np.zeros((3, len(catalog)), dtype=bool)
+    failed = np.zeros_like(passed)
+    failed[:, 0] = True
+    table = CohortAnalytics(catalog).analyze(passed, failed, policy=policy)
+    assert bottlenecks(table, top=1)['Course Code'].tolist() == ['A100']
+    assert failure_cascades(table)['Course Code'].tolist() == ['A100']
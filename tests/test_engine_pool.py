@@ -0,0 +1,73 @@
+import threading
+
+import pytest
+
+from engine_pool import EnginePool
+
+
+class FakeEngine:
+    """Stands in for a knowledge engine: holds per-request facts until reset"""
+
+    def __init__(self):
+        self.facts = []
+        self.resets = 0
+
+    def reset(self):
+        self.facts = []
+        self.resets += 1
+
+
+def test_engines_are_reset_before_reuse():
+    pool = EnginePool(FakeEngine, size=1)
+    with pool.engine() as engine:
+        assert engine.resets == 1
+        engine.facts.append('student')
+    with pool.engine() as again:
+        assert again is engine and again.facts == []
+
+
+def test_engine_is_returned_and_reset_when_the_request_fails():
+    pool = EnginePool(FakeEngine, size=1)
+    with pytest.raises(RuntimeError):
+        with pool.engine() as engine:
+            engine.facts.append('student')
+            raise RuntimeError
+    assert engine.facts == [] and pool.metrics()['idle'] == 1 and pool.metrics()['in_use'] == 0
+
+
+def test_checkout_times_out_when_every_engine_is_busy():
+    pool = EnginePool(FakeEngine, size=1, timeout=0.01)
+    with pool.engine():
+        with pytest.raises(TimeoutError):
+            with pool.engine():
+                pass
+        with pytest.raises(TimeoutError):
+            with pool.engine(timeout=0):
+                pass
+    metrics = pool.metrics()
+    assert metrics['timeouts'] == 2 and metrics['checkouts'] == 1 and metrics['idle'] == 1
+
+
+def test_concurrent_requests_never_share_an_engine():
+    pool = EnginePool(FakeEngine, size=3)
+    holders = {}
+    shared = []
+    lock = threading.Lock()
+
+    def request():
+        for _ in range(200):
+            with pool.engine() as engine:
+                with lock:
+                    if id(engine) in holders:
+                        shared.append(engine)
+                    holders[id(engine)] = threading.get_ident()
+                with lock:
+                    del holders[id(engine)]
+
+    threads = [threading.Thread(target=request) for _ in range(6)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    metrics = pool.metrics()
+    assert not shared and metrics['checkouts'] == 1200 and metrics['peak_in_use'] <= 3
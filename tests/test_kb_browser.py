@@ -0,0 +1,56 @@
+import pandas as pd
+
+from catalog import DEFAULT_TRACK
+from conftest import CATALOG_FILE
+from kb_browser import CatalogBrowser, page_count
+
+
+def browser_frame():
+    return pd.DataFrame({
+        'Course Code': ['CSE101', 'CSE102', 'MAT101', 'AIE201', 'CSE201'],
+        'Course Name': ['Programming I', 'Programming II', 'Calculus', 'Machine Learning', 'Cloud Computing'],
+        'Description': ['Intro to programming', 'Data structures', 'Limits', 'Learning from data', ''],
+        'Prerequisites': ['', 'CSE101', None, 'MAT101, CSE102', 'cse102'],
+        'Co-requisites': ['', '', '', '', ''],
+        'Credit Hours': [3, 3, 4, 3, None],
+        'Semester Offered': ['Fall', 'Spring', 'Both', 'Fall', 'Spring'],
+        'Program/Track': ['All', 'Computer Engineering', 'All', 'AI Engineering', None],
+    })
+
+
+def codes(browser, rows):
+    return browser.df['Course Code'].iloc[rows].tolist()
+
+
+def test_filters_combine():
+    browser = CatalogBrowser(browser_frame())
+    assert codes(browser, browser.search(code_prefix='cse')) == ['CSE101', 'CSE102', 'CSE201']
+    assert codes(browser, browser.search(keywords='programming')) == ['CSE101', 'CSE102']
+    assert codes(browser, browser.search(keywords='programming data')) == ['CSE102']
+    assert codes(browser, browser.search(semester='Spring')) == ['CSE102', 'MAT101', 'CSE201']
+    assert codes(browser, browser.search(credit_hours=4)) == ['MAT101']
+    assert codes(browser, browser.search(prerequisite='CSE102')) == ['AIE201', 'CSE201']
+    assert codes(browser, browser.search(code_prefix='CSE', semester='Fall')) == ['CSE101']
+    assert len(browser.search(keywords='quantum')) == 0
+
+
+def test_track_filter_includes_universal_and_blank_track_rows():
+    browser = CatalogBrowser(browser_frame())
+    assert codes(browser, browser.search(track=DEFAULT_TRACK)) == ['CSE101', 'CSE102', 'MAT101', 'CSE201']
+    assert codes(browser, browser.search(track='AI Engineering')) == ['CSE101', 'MAT101', 'AIE201']
+
+
+def test_track_filter_agrees_with_the_compiled_catalog(catalog):
+    browser = CatalogBrowser(pd.read_csv(CATALOG_FILE))
+    for track in catalog.tracks:
+        assert codes(browser, browser.search(track=track)) == \
+            [catalog.courses[i]['code'] for i in sorted(catalog.track_course_ids(track))]
+
+
+def test_paging():
+    browser = CatalogBrowser(browser_frame())
+    rows = browser.search()
+    assert browser.page(rows, page=1, page_size=2)['Course Code'].tolist() == ['MAT101', 'AIE201']
+    assert browser.page(rows, page=3, page_size=2).empty
+    assert page_count(0) == 1
+    assert page_count(5, page_size=2) == 3
@@ -0,0 +1,82 @@
+import numpy as np
+import pandas as pd
+
+from kb_validator import _cycle_members, _peel, validate_catalog
+
+
+def cycle_members(n, edges):
+    src, dst = np.array(edges, dtype=np.int64).reshape(-1, 2).T
+    return _cycle_members(n, src, dst).tolist()
+
+
+def test_acyclic_graph_has_no_cycle_members():
+    assert cycle_members(4, [(0, 1), (1, 2), (0, 2), (2, 3)]) == []
+    assert cycle_members(3, []) == []
+
+
+def test_two_cycles_joined_by_a_path():
+    # A <-> B, X -> A, C -> X, C <-> D: X sits between two cycles but is on neither
+    a, b, x, c, d = range(5)
+    assert cycle_members(5, [(a, b), (b, a), (x, a), (c, x), (c, d), (d, c)]) == [a, b, c, d]
+
+
+def test_self_loop_and_long_cycle():
+    assert cycle_members(3, [(1, 1)]) == [1]
+    assert cycle_members(6, [(0, 1), (1, 2), (2, 3), (3, 0), (3, 4), (5, 0)]) == [0, 1, 2, 3]
+
+
+def test_deep_chain_does_not_recurse():
+    n = 5000
+    edges = [(i, i + 1) for i in range(n - 1)] + [(n - 1, 0)]
+    assert cycle_members(n, edges) == list(range(n))
+
+
+def catalog_frame(rows):
+    return pd.DataFrame(rows, columns=['Course Code', 'Course Name', 'Description', 'Prerequisites',
+                                       'Co-requisites', 'Credit Hours', 'Semester Offered', 'Program/Track'])
+
+
+def test_validator_reports_only_cycle_courses():
+    df = catalog_frame([
+        ['A100', 'A', '', 'B100', '', 3, 'Fall', 'All'],
+        ['B100', 'B', '', 'A100', '', 3, 'Fall', 'All'],
+        ['X100', 'X', '', 'C100', '', 3, 'Fall', 'All'],
+        ['A200', 'A2', '', 'X100', '', 3, 'Fall', 'All'],
+        ['C100', 'C', '', '', '', 3, 'Fall', 'All'],
+    ])
+    cycles = {f['code'] for f in validate_catalog(df) if f['check'] == 'prerequisite_cycle'}
+    assert cycles == {'A100', 'B100'}
+
+
+def test_validator_checks_requirement_order_within_a_study_year():
+    df = catalog_frame([
+        ['ALE112', 'Second term', '', '', '', 3, 'Spring', 'All'],
+        ['ALE121', 'First term', '', 'ALE112', '', 3, 'Fall', 'All'],
+        ['ALE212', 'Next year', '', 'ALE112', '', 3, 'Fall', 'All'],
+        ['ALE130', 'Whole number credits', '', '', '', '3.0', 'Fall', ''],
+    ])
+    findings = validate_catalog(df)
+    assert [(f['check'], f['code']) for f in findings if f['check'] == 'prerequisite_offered_after'] == \
+        [('prerequisite_offered_after', 'ALE121')]
+    assert not any(f['check'] == 'invalid_credit_hours' for f in findings)
+    assert [f['code'] for f in findings if f['check'] == 'blank_track'] == ['ALE130']
+
+
+def test_blank_credit_hours_mean_zero():
+    df = catalog_frame([
+        ['A100', 'A', '', '', '', None, 'Fall', 'All'],
+        ['B100', 'B', '', '', '', ' ', 'Fall', 'All'],
+        ['C100', 'C', '', '', '', 'three', 'Fall', 'All'],
+        ['D100', 'D', '', '', '', -1, 'Fall', 'All'],
+    ])
+    bad = [f['code'] for f in validate_catalog(df) if f['check'] == 'invalid_credit_hours']
+    assert bad == ['C100', 'D100']
+
+
+def test_peeling_leaves_only_the_cyclic_core():
+    # A long acyclic tail hanging off a small cycle is peeled before the SCC pass
+    n = 2000
+    edges = [(i, i + 1) for i in range(3, n - 1)] + [(0, 1), (1, 2), (2, 0), (2, 3)]
+    src, dst = np.array(edges, dtype=np.int64).T
+    assert _peel(n, src, dst).sum() == 3
+    assert cycle_members(n, edges) == [0, 1, 2]
@@ -0,0 +1,78 @@
+import json
+import os
+
+import numpy as np
+import pytest
+
+from catalog import CompiledCatalog
+from cohort_analytics import CohortAnalytics
+from conftest import make_course
+from policy import DEFAULT_POLICY_FILE, DEFAULT_RULES, Policy, get_policy, load_policy
+
+
+def test_default_rules_match_the_shipped_policy_file():
+    with open(DEFAULT_POLICY_FILE, 'r', encoding='utf-8') as file:
+        assert json.load(file) == DEFAULT_RULES
+    assert load_policy(DEFAULT_POLICY_FILE).version == Policy(DEFAULT_RULES).version
+
+
+def test_inclusive_and_exclusive_bounds(policy):
+    # CGPA < 2.0 gets 12, CGPA <= 3.0 gets 15, anything higher 18
+    cases = [(0.0, 12), (np.nextafter(2.0, 0), 12), (2.0, 15), (3.0, 15), (np.nextafter(3.0, 4), 18), (4.0, 18)]
+    for cgpa, credits in cases:
+        assert policy.credit_limit(cgpa) == credits
+    np.testing.assert_array_equal(policy.credit_limits([cgpa for cgpa, _ in cases]), [c for _, c in cases])
+
+
+def test_batch_limits_match_single_student_limits():
+    policy = Policy(dict(DEFAULT_RULES, term_max_credits={'Summer': 9}))
+    rng = np.random.default_rng(0)
+    cgpa = np.round(rng.uniform(0, 4, 500), 1)
+    semesters = rng.choice(['Fall', 'Spring', 'summer', ' SUMMER '], 500)
+    expected = [policy.credit_limit(c, s) for c, s in zip(cgpa.tolist(), semesters.tolist())]
+    np.testing.assert_array_equal(policy.credit_limits(cgpa, semesters), expected)
+    np.testing.assert_array_equal(policy.credit_limits(cgpa, 'summer'), np.minimum(policy.credit_limits(cgpa), 9))
+
+
+def test_tier_cgpas_land_in_every_tier(policy):
+    assert [policy.credit_limit(cgpa) for cgpa in policy.tier_cgpas()] == [12, 15, 18]
+
+
+@pytest.mark.parametrize('tiers', [
+    [],
+    [{'max_cgpa': 2.0, 'max_credits': 12}],
+    [{'max_cgpa': 3.0, 'max_credits': 12}, {'max_cgpa': 2.0, 'max_credits': 15}, {'max_credits': 18}],
+    [{'max_cgpa': 2.0, 'inclusive': True, 'max_credits': 12}, {'max_cgpa': 2.0, 'max_credits': 15},
+     {'max_credits': 18}],
+])
+def test_malformed_tiers_are_rejected(tiers):
+    with pytest.raises(ValueError):
+        Policy(dict(DEFAULT_RULES, credit_tiers=tiers))
+
+
+def test_shared_tracks_open_other_tracks_courses():
+    catalog = CompiledCatalog([
+        make_course('A100', track='AI Engineering'),
+        make_course('B100', track='Robotics'),
+        make_course('C100', track='All'),
+    ])
+    policy = Policy(dict(DEFAULT_RULES, shared_tracks={'Robotics': ['AI Engineering']}))
+    assert policy.candidates(catalog, 'Robotics', 'Fall') == (0, 1, 2)
+    assert policy.candidates(catalog, 'AI Engineering', 'Fall') == (0, 2)
+
+    passed = np.zeros((1, 3), dtype=bool)
+    table = CohortAnalytics(catalog).analyze(passed, passed, track='Robotics', policy=policy)
+    assert table['Eligible Next Term'].tolist() == [1, 1, 1]
+
+
+def test_get_policy_recompiles_when_the_file_changes(tmp_path):
+    filename = str(tmp_path / 'policy.json')
+    assert get_policy(filename).rules == DEFAULT_RULES
+    with open(filename, 'w', encoding='utf-8') as file:
+        json.dump(dict(DEFAULT_RULES, term_max_credits={'fall': 9}), file)
+    first = get_policy(filename)
+    assert first.credit_limit(4.0, 'Fall') == 9 and get_policy(filename) is first
+    with open(filename, 'w', encoding='utf-8') as file:
+        json.dump(DEFAULT_RULES, file)
+    os.utime(filename, (0, 0))
+    assert get_policy(filename).credit_limit(4.0, 'Fall') == 18
@@ -0,0 +1,62 @@
+import numpy as np
+
+from ranking import CourseRanker
+from recommender import make_profile, recommend
+from what_if import WhatIfSession
+
+
+def dense_matrix(ranker):
+    """The ranker's TF-IDF rows as a dense courses x terms matrix"""
+    return np.array([ranker._row_vector(course_id) for course_id in range(len(ranker.catalog))])
+
+
+def test_scores_match_dense_dot_products(catalog):
+    ranker = CourseRanker(catalog)
+    matrix = dense_matrix(ranker)
+    query = ranker.query_vector({'MAT111', 'CSE014'}, 'cloud computing networks')
+    rng = np.random.default_rng(0)
+    for size in (1, 5, len(catalog)):
+        course_ids = rng.choice(len(catalog), size=size, replace=False)
+        np.testing.assert_allclose(ranker.scores(course_ids, query), matrix[course_ids] @ query)
+
+
+def test_scores_handle_repeated_and_empty_rows(catalog):
+    ranker = CourseRanker(catalog)
+    query = ranker.query_vector(interest='programming')
+    empty = [course_id for course_id in range(len(catalog)) if ranker.indptr[course_id] == ranker.indptr[course_id + 1]]
+    course_ids = [3, 3, 0] + empty[:1]
+    expected = dense_matrix(ranker)[course_ids] @ query
+    np.testing.assert_allclose(ranker.scores(course_ids, query), expected)
+
+
+def test_scores_of_empty_selection_or_query(catalog):
+    ranker = CourseRanker(catalog)
+    assert len(ranker.scores([], ranker.query_vector(interest='cloud'))) == 0
+    np.testing.assert_array_equal(ranker.scores([0, 1, 2], np.zeros(len(ranker.vocabulary))), np.zeros(3))
+
+
+def test_rows_are_normalized(catalog):
+    norms = np.linalg.norm(dense_matrix(CourseRanker(catalog)), axis=1)
+    np.testing.assert_allclose(norms[norms > 0], 1.0)
+
+
+def test_ranked_recommendation_fills_the_limit_with_relevant_courses(catalog, policy):
+    ranker = CourseRanker(catalog)
+    profile = make_profile(1.5, 'Fall', {'MAT111', 'CSE014'})
+    ranked = recommend(catalog, profile, policy, ranker, 'cloud computing')
+    plain = recommend(catalog, profile, policy)
+    assert ranked.max_credits == plain.max_credits and ranked.total_credits <= ranked.max_credits
+    # Same eligible set, only the packing order differs
+    assert {e['code'] for e in ranked.explanations} == {e['code'] for e in plain.explanations}
+    order = ranker.rank(policy.candidates(catalog, profile.track, profile.semester), profile.passed,
+                        'cloud computing')
+    position = {catalog.courses[course_id]['code']: i for i, course_id in enumerate(order)}
+    assert [e['code'] for e in ranked.explanations] == sorted(position, key=position.get)
+
+
+def test_what_if_ranking_matches_ranked_recommend(catalog, policy):
+    ranker = CourseRanker(catalog)
+    session = WhatIfSession(catalog, 3.5, 'Spring', passed={'MAT111'}, ranker=ranker, interest='networks',
+                            policy=policy)
+    expected = recommend(catalog, make_profile(3.5, 'Spring', {'MAT111'}), policy, ranker, 'networks')
+    assert session.result == expected
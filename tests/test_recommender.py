@@ -0,0 +1,65 @@
+from conftest import random_profiles
+from recommender import make_profile, recommend, recommend_many
+
+
+def baseline_recommend(catalog, cgpa, semester, passed, failed, track):
+    """The original rule-engine pass: every catalog course in order, checked one rule at a time.
+
+    Courses outside the student's track or term are left out, as recommend no longer lists them.
+    """
+    max_credits = 12 if cgpa < 2.0 else 15 if cgpa <= 3.0 else 18
+    recommended = []
+    skipped = []
+    total_credits = 0
+    for course_id, course in enumerate(catalog.courses):
+        code = course['code']
+        if code in passed:
+            continue
+        if not (catalog.is_track_eligible(course_id, track) and catalog.is_semester_eligible(course_id, semester)):
+            continue
+        if code in failed:
+            skipped.append((code, 'previously_failed'))
+            continue
+        if any(p not in passed for p in course['prerequisites']):
+            skipped.append((code, 'missing_prerequisites'))
+            continue
+        codes = [c for c, _ in recommended]
+        if any(c not in passed and c not in codes for c in course['corequisites']):
+            skipped.append((code, 'missing_corequisites'))
+            continue
+        if total_credits + course['credit_hours'] > max_credits:
+            skipped.append((code, 'credit_limit'))
+            continue
+        recommended.append((code, course['credit_hours']))
+        total_credits += course['credit_hours']
+    return recommended, skipped, total_credits, max_credits
+
+
+def outcome(result):
+    """The parts of a result the baseline engine also produced"""
+    restricted = [
+        (e['code'], e['details']['reason']) for e in result.explanations
+        if e['type'] == 'restricted' and e['details']['reason'] != 'already_passed'
+    ]
+    return ([(c['code'], c['credit_hours']) for c in result.recommended], restricted,
+            result.total_credits, result.max_credits)
+
+
+def test_recommend_matches_baseline(catalog, policy):
+    for profile in random_profiles(catalog, 300):
+        expected = baseline_recommend(catalog, *profile)
+        assert outcome(recommend(catalog, profile, policy)) == expected
+
+
+def test_recommend_standard_case(catalog, policy):
+    result = recommend(catalog, make_profile(3.2, 'Fall', {'MAT111', 'CSE014'}), policy)
+    codes = {course['code'] for course in result.recommended}
+    assert result.max_credits == 18
+    assert result.total_credits <= 18
+    assert not codes & {'MAT111', 'CSE014'}
+
+
+def test_recommend_many_matches_serial_calls(catalog, policy):
+    profiles = list(random_profiles(catalog, 50, seed=1))
+    assert recommend_many(catalog, profiles, max_workers=4, policy=policy) == \
+        [recommend(catalog, profile, policy) for profile in profiles]
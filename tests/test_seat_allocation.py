@@ -0,0 +1,118 @@
+import numpy as np
+
+from catalog import CompiledCatalog
+from conftest import make_course
+from seat_allocation import UNLIMITED, allocate_seats, allocate_store, allocation_table
+from transcript_store import TranscriptStoreWriter, TranscriptStore
+
+
+def cohort(n, n_courses):
+    return np.zeros((n, n_courses), dtype=bool), np.zeros((n, n_courses), dtype=bool)
+
+
+def test_capacity_goes_to_highest_cgpa_first(policy):
+    catalog = CompiledCatalog([make_course('A100', capacity=2), make_course('B100')])
+    passed, failed = cohort(5, 2)
+    cgpa = np.array([2.5, 3.9, 1.0, 3.1, 3.9])
+    result = allocate_seats(catalog, cgpa, passed, failed, policy=policy)
+    assert result.assigned[:, 0].tolist() == [False, True, False, False, True]
+    assert result.assigned[:, 1].all()
+    assert result.capacity.tolist() == [2, UNLIMITED]
+    table = allocation_table(catalog, result)
+    assert table['Not Allocated'].tolist() == [3, 0]
+    assert table['Fill Rate'].iloc[0] == 1.0 and np.isnan(table['Fill Rate'].iloc[1])
+
+
+def test_seniority_breaks_cgpa_ties(policy):
+    catalog = CompiledCatalog([make_course('A100', capacity=1)])
+    passed, failed = cohort(3, 1)
+    result = allocate_seats(catalog, np.full(3, 3.0), passed, failed, seniority=np.array([10, 30, 20]),
+                            policy=policy)
+    assert result.assigned[:, 0].tolist() == [False, True, False]
+
+
+def test_credit_caps_follow_policy_tiers(policy):
+    catalog = CompiledCatalog([make_course(f"A{i}00", credit_hours=4) for i in range(1, 7)])
+    passed, failed = cohort(3, len(catalog))
+    cgpa = np.array([1.5, 2.5, 3.5])
+    result = allocate_seats(catalog, cgpa, passed, failed, policy=policy)
+    assert result.max_credits.tolist() == [12, 15, 18]
+    assert result.credits.tolist() == [12, 12, 16]
+    assert (result.credits <= result.max_credits).all()
+    assert (result.assigned.sum(axis=1) == result.credits // 4).all()
+
+
+def test_default_capacity_caps_courses_without_one(policy):
+    catalog = CompiledCatalog([make_course('A100'), make_course('B100', capacity=4)])
+    passed, failed = cohort(6, 2)
+    result = allocate_seats(catalog, np.full(6, 3.5), passed, failed, default_capacity=3, policy=policy)
+    assert result.assigned.sum(axis=0).tolist() == [3, 4]
+
+
+def test_retakes_take_priority(retake_policy):
+    catalog = CompiledCatalog([make_course('A100', capacity=1)])
+    passed, failed = cohort(2, 1)
+    failed[1, 0] = True
+    result = allocate_seats(catalog, np.array([4.0, 2.0]), passed, failed, policy=retake_policy)
+    assert result.assigned[:, 0].tolist() == [False, True]
+
+
+def test_corequisites_must_be_passed_or_granted(small_catalog, policy):
+    passed, failed = cohort(2, len(small_catalog))
+    b101, b100 = small_catalog.code_to_id['B101'], small_catalog.code_to_id['B100']
+    passed[1, b101] = True
+    cgpa = np.full(2, 3.5)
+    result = allocate_seats(small_catalog, cgpa, passed, failed, policy=policy)
+    assert result.assigned[0, b101] and result.assigned[0, b100]
+    assert result.assigned[1, b100] and not result.assigned[1, b101]
+
+    # Without a seat in B101, only the student who passed it can take B100
+    full_catalog = CompiledCatalog(
+        [dict(course, capacity=0) if course['code'] == 'B101' else course for course in small_catalog.courses]
+    )
+    full = allocate_seats(full_catalog, cgpa, passed, failed, policy=policy)
+    assert full.assigned[:, b100].tolist() == [False, True]
+
+
+def test_per_student_tracks(policy):
+    catalog = CompiledCatalog([make_course('A100', track='AI Engineering'), make_course('B100', track='Robotics')])
+    passed, failed = cohort(2, 2)
+    result = allocate_seats(catalog, np.full(2, 3.5), passed, failed, track=np.array(['AI Engineering', 'Robotics']),
+                            policy=policy)
+    assert result.assigned.tolist() == [[True, False], [False, True]]
+
+
+def test_store_allocation_matches_in_memory(catalog, policy, tmp_path):
+    rng = np.random.default_rng(0)
+    n = 300
+    passed = rng.random((n, len(catalog))) < 0.3
+    failed = (rng.random((n, len(catalog))) < 0.1) & ~passed
+    cgpa = rng.uniform(1.0, 4.0, n).astype(np.float32)
+
+    writer = TranscriptStoreWriter(str(tmp_path), catalog, n)
+    for start in range(0, n, 128):
+        end = start + 128
+        writer.append([f"S{i}" for i in range(start, min(end, n))], cgpa[start:end], passed[start:end],
+                      failed[start:end])
+    writer.close()
+    store = TranscriptStore(str(tmp_path), catalog)
+
+    streamed = allocate_store(catalog, store, default_capacity=25, policy=policy, batch_size=64)
+    expected = allocate_seats(catalog, cgpa.astype(float), passed, failed, default_capacity=25, policy=policy)
+    for got, want in zip(streamed, expected):
+        np.testing.assert_array_equal(got, want)
+    assert (streamed.assigned.sum(axis=0) <= 25).all()
+
+
+def test_granted_sections_never_clash(policy):
+    catalog = CompiledCatalog([
+        make_course('A100', meeting_times='Mon 09:00-10:30'),
+        make_course('B100', meeting_times='Mon 10:00-11:00'),
+        make_course('C100', meeting_times='A: Mon 10:00-11:00 | B: Tue 10:00-11:00'),
+        make_course('D100', meeting_times='Tue 10:30-12:00'),
+    ])
+    passed, failed = cohort(1, 4)
+    result = allocate_seats(catalog, np.array([3.5]), passed, failed, policy=policy)
+    # B100 clashes with A100; C100 falls back to its Tuesday section, which then blocks D100
+    assert result.assigned.tolist() == [[True, False, True, False]]
+    assert result.credits.tolist() == [6]
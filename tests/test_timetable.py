@@ -0,0 +1,60 @@
+import pytest
+
+from catalog import SLOTS_PER_DAY, CompiledCatalog, meeting_mask, parse_sections
+from conftest import make_course
+from recommender import make_profile, recommend
+
+
+def slots(day, first, last):
+    """Mask of slots first..last-1 on a weekday index"""
+    return ((1 << (last - first)) - 1) << (day * SLOTS_PER_DAY + first)
+
+
+@pytest.mark.parametrize('value', [None, '', '   ', float('nan'), 3])
+def test_blank_or_non_text_meeting_times_are_unscheduled(value):
+    assert parse_sections(value) == ()
+
+
+def test_unlabelled_sections_are_numbered():
+    sections = parse_sections('Mon 09:00-10:00 | Tue 09:00-10:00')
+    assert [label for label, _ in sections] == ['S1', 'S2']
+    assert sections[0][1] == slots(0, 36, 40)
+    assert sections[1][1] == slots(1, 36, 40)
+
+
+def test_labelled_section_with_several_meetings():
+    ((label, mask),) = parse_sections(' A : Mon/Wednesday 09:00-10:30; Fri 8:00 - 9:00 ')
+    assert label == 'A'
+    assert mask == slots(0, 36, 42) | slots(2, 36, 42) | slots(4, 32, 36)
+
+
+def test_partial_slots_round_outwards():
+    assert meeting_mask('mon', '09:10', '09:20') == slots(0, 36, 38)
+    assert meeting_mask('sun', '23:45', '24:00') == slots(6, 95, 96)
+
+
+@pytest.mark.parametrize('value', [
+    'Funday 09:00-10:00',
+    'Mon 10:00-09:00',
+    'Mon 09:00-09:00',
+    'Mon 09:00-25:00',
+    'Mon 9-10',
+    'Mon 09:00-10:00;',
+    'Mon 09:00-10:00 |',
+])
+def test_malformed_meeting_times_raise(value):
+    with pytest.raises(ValueError):
+        parse_sections(value)
+
+
+def test_recommendations_take_the_first_section_that_fits(policy):
+    catalog = CompiledCatalog([
+        make_course('A100', meeting_times='Mon 09:00-10:30'),
+        make_course('B100', meeting_times='Mon 10:00-11:00'),
+        make_course('C100', meeting_times='A: Mon 10:00-11:00 | B: Tue 10:00-11:00'),
+        make_course('D100'),
+    ])
+    result = recommend(catalog, make_profile(3.5, 'Fall', set()), policy)
+    assert [course['code'] for course in result.recommended] == ['A100', 'C100', 'D100']
+    clash = next(e for e in result.explanations if e['code'] == 'B100')
+    assert clash['details']['reason'] == 'time_clash' and clash['details']['clashes_with'] == ['A100']
@@ -0,0 +1,63 @@
+import numpy as np
+import pytest
+
+from catalog import CompiledCatalog
+from conftest import make_course
+from transcript_store import TranscriptStore, TranscriptStoreWriter, convert_cohort_csv
+
+
+def test_store_round_trip(small_catalog, tmp_path):
+    rng = np.random.default_rng(0)
+    n = 20
+    passed = rng.random((n, len(small_catalog))) < 0.5
+    failed = (rng.random((n, len(small_catalog))) < 0.3) & ~passed
+    writer = TranscriptStoreWriter(str(tmp_path), small_catalog, n)
+    writer.append([f"S{i}" for i in range(12)], np.full(12, 3.0), passed[:12], failed[:12], term=np.arange(12))
+    writer.append([f"S{i}" for i in range(12, n)], np.full(8, 2.0), passed[12:], failed[12:])
+    writer.close()
+
+    store = TranscriptStore(str(tmp_path), small_catalog)
+    assert len(store) == n
+    batches = list(store.batches(batch_size=7))
+    np.testing.assert_array_equal(np.vstack([b[0] for b in batches]), passed)
+    np.testing.assert_array_equal(np.vstack([b[1] for b in batches]), failed)
+    assert store.term.tolist() == list(range(12)) + [0] * 8
+    record = store.student(3)
+    assert record['student_id'] == 'S3' and record['term'] == 3
+    assert record['passed_courses'] == [small_catalog.courses[i]['code'] for i in np.flatnonzero(passed[3])]
+
+
+def test_store_rejects_another_catalog_version(small_catalog, tmp_path):
+    TranscriptStoreWriter(str(tmp_path), small_catalog, 0).close()
+    with pytest.raises(ValueError):
+        TranscriptStore(str(tmp_path), CompiledCatalog([make_course('Z100')]))
+
+
+def test_writer_rejects_ids_and_terms_that_do_not_fit(small_catalog, tmp_path):
+    writer = TranscriptStoreWriter(str(tmp_path), small_catalog, 4, id_width=4)
+    empty = np.zeros((1, len(small_catalog)), dtype=bool)
+    with pytest.raises(ValueError):
+        writer.append(['S12345'], [3.0], empty, empty)
+    for term in (1.5, np.nan, -1, 40000):
+        with pytest.raises(ValueError):
+            writer.append(['S1'], [3.0], empty, empty, term=[term])
+    writer.append(['S1'], [3.0], empty, empty, term=[32767])
+    assert writer.position == 1
+
+
+def test_convert_csv_with_padded_headers_and_long_ids(small_catalog, tmp_path):
+    csv = tmp_path / 'cohort.csv'
+    long_id = 'STUDENT-000000000000000001'
+    csv.write_text(
+        ' Student ID , CGPA , Passed Courses , Failed Courses , Term \n'
+        f'{long_id},3.5,"A100, B101",,2\n'
+        'NA,2.0,,C100, \n'
+    )
+    store = convert_cohort_csv(small_catalog, str(csv), str(tmp_path / 'store'), chunksize=1)
+    assert store.student(0) == {
+        'student_id': long_id, 'cgpa': 3.5, 'term': 2,
+        'passed_courses': ['A100', 'B101'], 'failed_courses': []
+    }
+    # 'NA' is an id, not a missing value, and the blank term is stored as 0
+    assert store.student(1)['student_id'] == 'NA'
+    assert store.student(1)['term'] == 0 and store.student(1)['failed_courses'] == ['C100']
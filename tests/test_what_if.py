@@ -0,0 +1,51 @@
+import random
+
+import pytest
+
+from conftest import random_profiles
+from recommender import make_profile, recommend
+from what_if import WhatIfSession
+
+
+@pytest.mark.parametrize('use_retake_policy', [False, True])
+def test_what_if_matches_full_recompute(catalog, policy, retake_policy, use_retake_policy):
+    policy = retake_policy if use_retake_policy else policy
+    rng = random.Random(1)
+    codes = [course['code'] for course in catalog.courses]
+    for start in random_profiles(catalog, 20, seed=2):
+        session = WhatIfSession(catalog, start.cgpa, start.semester, start.track, start.passed, start.failed,
+                                policy=policy)
+        assert session.result == recommend(catalog, start, policy)
+        cgpa = start.cgpa
+        for _ in range(5):
+            passed = set(rng.sample(codes, rng.randint(0, 30)))
+            failed = set(rng.sample(codes, 3)) - passed
+            cgpa = rng.choice([1.5, 2.5, 3.5])
+            result = session.update(passed, failed, cgpa)
+            assert result == recommend(catalog, make_profile(cgpa, start.semester, passed, failed, start.track),
+                                       policy)
+
+        passed, failed = session.passed, session.failed
+        scenario = session.what_if(pass_courses=[codes[0]], fail_courses=[codes[1]])
+        expected = make_profile(cgpa, start.semester, (passed | {codes[0]}) - {codes[1]},
+                                (failed | {codes[1]}) - {codes[0]}, start.track)
+        assert scenario == recommend(catalog, expected, policy)
+        # What-if scenarios leave the session untouched
+        assert (session.passed, session.failed) == (passed, failed)
+
+
+def test_what_if_reevaluates_only_affected_courses(catalog, policy):
+    session = WhatIfSession(catalog, 3.5, 'Fall', policy=policy)
+    session.update(passed={'MAT111'})
+    affected = {catalog.code_to_id['MAT111']} | catalog.dependent_ids('MAT111')
+    assert session.last_evaluated == len(affected & set(session.candidate_ids))
+
+
+def test_ruled_out_entries_are_rebuilt_only_for_changed_courses(catalog, policy):
+    session = WhatIfSession(catalog, 3.5, 'Fall', passed={'MAT111'}, policy=policy)
+    kept = dict(session.restrictions)
+    session.update(passed={'MAT111', 'CSE014'})
+    changed = {catalog.code_to_id['CSE014']} | catalog.dependent_ids('CSE014')
+    for course_id, entry in session.restrictions.items():
+        if course_id not in changed:
+            assert entry is kept[course_id]